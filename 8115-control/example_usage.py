@@ -5,16 +5,84 @@ This script demonstrates how to use the GIM8115Driver to control a motor.
 # python3 example_usage.py
 """
 
+import atexit
+import functools
+import logging
+import os
 import time
 import math
+from typing import Optional
 from gim8115_driver import (
     GIM8115Driver, 
     GIM8115Error, 
     GIM8115ResultError,
     INDIID_MEC_ANGLE_SHAFT,
-    INDIID_SPEED_SHAFT
+    INDIID_SPEED_SHAFT,
+    set_realtime_scheduling
 )
 
+log = logging.getLogger(__name__)
+
+
+# Position sequence: (target angle in degrees, move duration in ms, settle time in ms)
+WAYPOINTS = (
+    (60, 100, 2000),
+    (-60, 100, 2000),
+    (120, 100, 2000),
+    (0, 100, 3000),
+)
+
+# Target angles in radians, converted once at import so every run sends identical commands
+WAYPOINT_ANGLES_RAD = tuple(math.radians(target_deg) for target_deg, _, _ in WAYPOINTS)
+
+# Fine positioning pair: (angle in radians, move duration in ms), each held for DITHER_SETTLE_MS
+# after its move so the motor reaches -2 degrees before being sent to +2 degrees
+DITHER_TARGETS = ((math.radians(-2), 100), (math.radians(2), 100))
+DITHER_SETTLE_MS = 100
+
+# Return to zero after fine positioning, same layout as WAYPOINTS (3 s hold in total)
+RETURN_WAYPOINTS = (
+    (0, 100, 2900),
+)
+RETURN_ANGLES_RAD = tuple(math.radians(target_deg) for target_deg, _, _ in RETURN_WAYPOINTS)
+
+
+def goto(
+    motor: GIM8115Driver,
+    target_deg: float,
+    target_rad: float,
+    duration_ms: int = 100,
+    settle_ms: int = 0,
+    start: Optional[float] = None
+) -> float:
+    """
+    Send one position command and hold until the move and settle time are over
+    
+    Args:
+        motor: Connected and started driver
+        target_deg: Target angle in degrees (only used for the log line)
+        target_rad: Target angle in radians (sent to the motor)
+        duration_ms: Move duration in milliseconds
+        settle_ms: Extra time to hold the position after the move, in milliseconds
+        start: time.monotonic() time the move is scheduled from (default: now). Pass the
+               previous goto() result to pace a sequence without accumulating drift.
+    
+    Returns:
+        time.monotonic() deadline at which the move and settle time ended
+    """
+    if start is None:
+        start = time.monotonic()
+    log.info("\n--- Position %s degrees ---\nMoving to %.1f degrees in %dms", target_deg, target_deg, duration_ms)
+    motor.send_position(target_rad, duration_ms)
+    deadline = start + (duration_ms + settle_ms) / 1000.0
+    _sleep_until(deadline)
+    return deadline
+
+
+def _sleep_until(deadline: float) -> None:
+    """Sleep until a time.monotonic() deadline (returns immediately if already past)"""
+    time.sleep(max(0.0, deadline - time.monotonic()))
+
 
 def main():
     """Example motor control sequence"""
@@ -23,6 +91,10 @@ def main():
     TORQUE_CONSTANT = 1 # N⋅m/A (example value, check motor datasheet)
     GEAR_RATIO = 36  # Example gear ratio
     
+    # Pin control thread to an isolated core with SCHED_FIFO to avoid scheduler jitter
+    if not set_realtime_scheduling():
+        log.warning("⚠️  Real-time scheduling not permitted (add rtprio entry to /etc/security/limits.conf)")
+    
     # Initialize driver
     # Using context manager for automatic connection/disconnection
     try:
@@ -39,72 +111,35 @@ def main():
             # motor.set_zero_position()
             # time.sleep(0.1)
             
-            print("Connected to GIM8115 motor")
-            print("Current position: ", motor.get_current_position())
-            print("Current speed: ", motor.retrieve_indicator(INDIID_SPEED_SHAFT))
+            # Fail fast if the motor is not answering before starting the sequence
+            if not motor.ping(timeout=0.1):
+                raise GIM8115Error("No response from motor (check power and CAN wiring)")
+            
+            log.info("Connected to GIM8115 motor")
+            log.info("Current position: %s", motor.get_current_position())
+            log.info("Current speed: %s", motor.retrieve_indicator(INDIID_SPEED_SHAFT))
             
             # Start safety listener to monitor CAN ID 0x005 for limit switches
-            print("\nStarting safety listener (CAN ID 0x005)...")
+            log.info("\nStarting safety listener (CAN ID 0x005)...")
             motor.start_safety_listener(auto_stop=True)  # Automatically stop motor on limit trigger
             
             # Start the motor
-            print("\nStarting motor...")
+            log.info("\nStarting motor...")
             motor.start_motor()
             time.sleep(0.3)  # Wait for motor to start
             
-            # # Example 1: Position control
-            print("\n--- Position 60 degrees ---")
-            target_angle = 2 * math.pi /360 * 60  
-            duration = 100  # 100ms seconds
-            print(f"Moving to {math.degrees(target_angle):.1f} degrees in {duration}ms")          
-            motor.send_position(target_angle, duration)     
-            time.sleep(2)
-            
-
-            print("\n--- Position -60 degrees ---")
-            target_angle = 2 * math.pi /360 * -60   
-            duration = 100  # 100ms seconds
-            print(f"Moving to {math.degrees(target_angle):.1f} degrees in {duration}ms")            
-            motor.send_position(target_angle, duration)     
-            time.sleep(2)
-
-            # # Example 1: Position control
-            print("\n--- Position 120 degrees ---")
-            target_angle = 2 * math.pi /360 * 120  
-            duration = 100  # 100ms seconds
-            print(f"Moving to {math.degrees(target_angle):.1f} degrees in {duration}ms")          
-            motor.send_position(target_angle, duration)     
-            time.sleep(2)
-
-            print("\n--- Position 0 degrees ---")
-            target_angle = 2 * math.pi /360 * 0   
-            duration = 100  # 100ms seconds
-            print(f"Moving to {math.degrees(target_angle):.1f} degrees in {duration}ms")            
-            motor.send_position(target_angle, duration)     
-            time.sleep(3)
-
-            print("\n--- Position 0 degrees ---")
-            target_angle = 2 * math.pi /360 * -2
-            duration = 100  # 100ms seconds
-            print(f"Moving to {math.degrees(target_angle):.1f} degrees in {duration}ms")            
-            motor.send_position(target_angle, duration)              
-            time.sleep(0.1)
-
-            print("\n--- Position 0 degrees ---")
-            target_angle = 2 * math.pi /360 * 2
-            duration = 100  # 100ms seconds
-            print(f"Moving to {math.degrees(target_angle):.1f} degrees in {duration}ms")            
-            motor.send_position(target_angle, duration)              
-            time.sleep(0.1)
-
-
-
-            print("\n--- Position 0 degrees ---")
-            target_angle = 2 * math.pi /360 * 0   
-            duration = 100  # 100ms seconds
-            print(f"Moving to {math.degrees(target_angle):.1f} degrees in {duration}ms")            
-            motor.send_position(target_angle, duration)     
-            time.sleep(3)
+            # Example 1: Position control sequence
+            # Each move is paced against a monotonic deadline, so time spent in
+            # send_position() is absorbed by the settle time instead of adding to it
+            next_deadline = time.monotonic()
+            for (target_deg, duration, settle_ms), target_angle in zip(WAYPOINTS, WAYPOINT_ANGLES_RAD):
+                next_deadline = goto(motor, target_deg, target_angle, duration, settle_ms, next_deadline)
+
+            log.info("\n--- Fine positioning -2/+2 degrees ---")
+            next_deadline = motor.queue_positions(DITHER_TARGETS, settle_ms=DITHER_SETTLE_MS, start=next_deadline)
+
+            for (target_deg, duration, settle_ms), target_angle in zip(RETURN_WAYPOINTS, RETURN_ANGLES_RAD):
+                next_deadline = goto(motor, target_deg, target_angle, duration, settle_ms, next_deadline)
 
             # print("\n--- Position Control to Zero ---")
             # target_angle = 0.0  # 0.0 radians
@@ -161,60 +196,82 @@ def main():
             # time.sleep(2)
             
             # Example 5: Continuous position control loop
-            # print("\n--- Continuous Control Loop ---")
-            # print("Moving motor in sine wave pattern...")
-            
-            # start_time = time.time()
-            # duration_loop = 10.0  # Run for 10 seconds
-            
-            # while time.time() - start_time < duration_loop:
-            #     # Generate sine wave position command
-            #     t = time.time() - start_time
-            #     angle = math.sin(2 * math.pi * 0.5 * t) * (math.pi / 4)  # ±45 degrees at 0.5 Hz
-                
-            #     motor.send_position(angle, duration_ms=100)  # 100ms duration
-                
-            #     # Try to receive feedback (non-blocking)
-            #     try:
-            #         response = motor._receive_frame(timeout=0.05)
-            #         if response:
-            #             status = motor.parse_feedback(response, check_result=False)
-            #             print(f"t={t:.2f}s: pos={math.degrees(status.position_rad):.1f}°, "
-            #                   f"speed={status.speed_rads:.2f} rad/s")
-            #     except GIM8115Error:
-            #         pass  # No response yet, continue
-                
-            #     time.sleep(0.1)  # 10 Hz control loop
+            # sine_wave_example(motor)
             
             # Stop motor
-            print("\nStopping motor...")
-            motor.stop_motor()
-            time.sleep(0.1)
+            log.info("\nStopping motor...")
+            motor.stop_motor(ack_timeout=0.2)
             
-            print("\nExample completed successfully!")
+            log.info("\nExample completed successfully!")
             
     except GIM8115Error as e:
-        print(f"GIM8115 Error: {e}")
+        log.error("GIM8115 Error: %s", e)
     except KeyboardInterrupt:
-        print("\nInterrupted by user")
+        log.warning("\nInterrupted by user")
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        log.error("Unexpected error: %s", e)
+
+
+def sine_wave_example(motor: GIM8115Driver, duration_s: float = 10.0, rate_hz: float = 10.0):
+    """
+    Continuous position control loop: ±45 degrees sine wave at 0.5 Hz
+    
+    The whole trajectory is computed before the loop starts, so each iteration only
+    sends a precomputed angle and sleeps until its monotonic deadline.
+    
+    Args:
+        motor: Connected and started driver
+        duration_s: How long to run the pattern in seconds
+        rate_hz: Control loop rate in Hz
+    """
+    log.info("\n--- Continuous Control Loop ---")
+    log.info("Moving motor in sine wave pattern...")
+    
+    period = 1.0 / rate_hz
+    steps = int(duration_s * rate_hz)
+    phase_step = math.tau * 0.5 * period  # 0.5 Hz, one multiply per sample
+    amplitude = math.radians(45)
+    trajectory = tuple(math.sin(phase_step * i) * amplitude for i in range(steps))
+    
+    start_time = time.monotonic()
+    for i, angle in enumerate(trajectory):
+        motor.send_position(angle, duration_ms=100)  # 100ms duration
+        
+        # Poll fresh position and speed (indicator round trip, never a stale queued reply)
+        status = motor.get_motor_status(timeout=0.05)
+        if status is not None:
+            log.info("t=%.2fs: pos=%.1f°, speed=%.2f rad/s",
+                     i * period, math.degrees(status.position_rad), status.speed_rads)
+        
+        _sleep_until(start_time + (i + 1) * period)
 
 
-def simple_position_example():
-    """Simplest possible example"""
+@functools.lru_cache(maxsize=1)
+def _default_driver() -> GIM8115Driver:
+    """Connect once and reuse the driver across calls (disconnected at interpreter exit)"""
     motor = GIM8115Driver(interface="can0", can_id=0x0A)
     motor.connect()
+    atexit.register(motor.disconnect)
+    return motor
+
+
+def simple_position_example(motor: Optional[GIM8115Driver] = None):
+    """
+    Simplest possible example
     
-    try:
-        motor.start_motor()
-        motor.send_position(angle_rad=math.pi / 2, duration_ms=1000)  # 90 degrees in 1 second
-        time.sleep(1.5)
-        motor.stop_motor()
-    finally:
-        motor.disconnect()
+    Args:
+        motor: Connected driver to use. If None, a shared module-level driver is
+               connected on first call and reused afterwards.
+    """
+    motor = motor or _default_driver()
+    
+    motor.start_motor()
+    motor.send_position(angle_rad=math.pi / 2, duration_ms=1000)  # 90 degrees in 1 second
+    time.sleep(1.5)
+    motor.stop_motor(ack_timeout=0.2)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING").upper(), format="%(message)s")
     main()
 
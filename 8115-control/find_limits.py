@@ -8,14 +8,19 @@ Usage:
     python3 find_limits.py
 """
 
+import logging
+import os
 import time
 import math
 from gim8115_driver import (
     GIM8115Driver, 
     GIM8115Error, 
-    GIM8115ResultError
+    GIM8115ResultError,
+    set_realtime_scheduling
 )
 
+log = logging.getLogger(__name__)
+
 
 def main():
     """
@@ -24,14 +29,18 @@ def main():
     This example demonstrates how to use find_position_limits() to automatically
     calibrate the physical limits of the motor system.
     """
-    print("=" * 60)
-    print("Finding Position Limits Automatically")
-    print("=" * 60)
+    deg = math.degrees
+    
+    log.info("%s\nFinding Position Limits Automatically\n%s", "=" * 60, "=" * 60)
     
     # Motor parameters (adjust based on your motor specifications)
     TORQUE_CONSTANT = 1  # N⋅m/A (example value, check motor datasheet)
     GEAR_RATIO = 10.0  # Example gear ratio
     
+    # Pin control thread to an isolated core with SCHED_FIFO to avoid scheduler jitter
+    if not set_realtime_scheduling():
+        log.warning("⚠️  Real-time scheduling not permitted (add rtprio entry to /etc/security/limits.conf)")
+    
     try:
         with GIM8115Driver(
             interface="can0",
@@ -41,63 +50,73 @@ def main():
             gear_ratio=GEAR_RATIO
         ) as motor:
             
-            print("\n1. Setting zero position...")
+            log.info("\n1. Setting zero position...")
             motor.set_zero_position()
-            print("   ✓ Zero position set")
+            log.info("   ✓ Zero position set")
             
-            print("\n2. Starting safety listener...")
-            print("   This monitors CAN ID 0x005 for limit switch events")
+            log.info("\n2. Starting safety listener...")
+            log.info("   This monitors CAN ID 0x005 for limit switch events")
             motor.start_safety_listener(auto_stop=True)
-            print("   ✓ Safety listener started")
+            log.info("   ✓ Safety listener started")
             
                 
             # Find limits using configured speed from config file
             # Speed can be configured via: motor.set_limit_find_speed(speed_rads)
-            print(f"   Using rotation speed: {motor.get_limit_find_speed():.2f} rad/s (~{math.degrees(motor.get_limit_find_speed()):.1f} deg/s)")
+            speed = motor.limit_find_speed
+            log.info("   Using rotation speed: %.2f rad/s (~%.1f deg/s)", speed, deg(speed))
             min_limit, max_limit = motor.find_position_limits(
-                timeout_seconds=60.0,     # Max 60 seconds per limit
-                check_interval=0.05       # Check safety messages every 50ms (20 Hz)
+                timeout_seconds=60.0      # Max 60 seconds per limit; waits wake on limit frames
             )
             
-            print("\n4. Limits found and saved!")
-            print(f"   Minimum limit: {math.degrees(min_limit):.2f}° ({min_limit:.4f} rad)")
-            print(f"   Maximum limit: {math.degrees(max_limit):.2f}° ({max_limit:.4f} rad)")
-            print(f"   Total range: {math.degrees(max_limit - min_limit):.2f}°")
-            
             # Verify limits from driver
-            saved_min, saved_max = motor.get_position_limits()
-            print(f"\n   Verified limits from driver:")
-            print(f"   Min: {math.degrees(saved_min):.2f}° ({saved_min:.4f} rad)")
-            print(f"   Max: {math.degrees(saved_max):.2f}° ({saved_max:.4f} rad)")
+            saved_min, saved_max = motor.position_limits
+            log.info("""
+4. Limits found and saved!
+   Minimum limit: %.2f° (%.4f rad)
+   Maximum limit: %.2f° (%.4f rad)
+   Total range: %.2f°
+   
+   Verified limits from driver:
+   Min: %.2f° (%.4f rad)
+   Max: %.2f° (%.4f rad)""",
+                     deg(min_limit), min_limit, deg(max_limit), max_limit, deg(max_limit - min_limit),
+                     deg(saved_min), saved_min, deg(saved_max), saved_max)
             
             # Check if limits match
             if abs(saved_min - min_limit) > 0.001 or abs(saved_max - max_limit) > 0.001:
-                print(f"   ⚠️  Warning: Limits don't match! Using returned values.")
-                print(f"      Returned: min={math.degrees(min_limit):.2f}°, max={math.degrees(max_limit):.2f}°")
-                print(f"      Saved: min={math.degrees(saved_min):.2f}°, max={math.degrees(saved_max):.2f}°")
+                log.warning("""   ⚠️  Warning: Limits don't match! Using returned values.
+      Returned: min=%.2f°, max=%.2f°
+      Saved: min=%.2f°, max=%.2f°""",
+                            deg(min_limit), deg(max_limit), deg(saved_min), deg(saved_max))
             else:
-                print(f"   ✓ Limits match!")                                   
+                log.info("   ✓ Limits match!")
             
+            log.info("\n5. Testing limits...")
+            log.info("   Moving to minimum, maximum, then center (2 s settle each)")
+            motor.start_motor()
+            motor.queue_positions(
+                [(min_limit, 300), (max_limit, 300), (0.0, 300)],
+                settle_ms=2000
+            )
+            log.info("   ✓ Limit test completed")
             
-            motor.stop_motor()
-            print("\n✓ Limit finding completed successfully!")
+            motor.stop_motor(ack_timeout=0.2)
+            log.info("\n✓ Limit finding completed successfully!")
             
     except GIM8115Error as e:
-        print(f"\n✗ GIM8115 Error: {e}")
-        print("   Make sure:")
-        print("   - Motor is connected and powered")
-        print("   - CAN bus is properly configured")
-        print("   - Safety limit switches are connected and working")
-        print("   - Motor can move freely in both directions")
+        log.error("\n✗ GIM8115 Error: %s\n"
+                  "   Make sure:\n"
+                  "   - Motor is connected and powered\n"
+                  "   - CAN bus is properly configured\n"
+                  "   - Safety limit switches are connected and working\n"
+                  "   - Motor can move freely in both directions", e)
     except KeyboardInterrupt:
-        print("\n\n✗ Interrupted by user")
-        print("   Motor should be stopped automatically")
+        log.warning("\n\n✗ Interrupted by user\n   Motor should be stopped automatically")
     except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("\n✗ Unexpected error: %s", e)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING").upper(), format="%(message)s")
     main()
 
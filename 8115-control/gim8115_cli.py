@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+GIM8115 Command Line Entry Point
+
+Runs the example scripts as subcommands of one process, so the driver and
+python-can are imported once per invocation.
+
+Usage:
+    python3 gim8115_cli.py -v demo          # show progress
+    python3 gim8115_cli.py find-limits      # warnings and errors only
+
+The default log level is taken from the LOGLEVEL environment variable (WARNING if unset).
+"""
+
+import argparse
+import logging
+import os
+
+import example_usage
+import find_limits
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="GIM8115 motor driver tools",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="count", default=0, help="Log progress (-vv: debug messages)")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="Only log warnings and errors")
+    subparsers = parser.add_subparsers(dest="cmd", required=True)
+    subparsers.add_parser("demo", help="Run the position control demo (example_usage.py)")
+    subparsers.add_parser("find-limits", help="Find and save position limits (find_limits.py)")
+    
+    args = parser.parse_args()
+    
+    if args.verbose:
+        level = logging.INFO if args.verbose == 1 else logging.DEBUG
+    elif args.quiet:
+        level = logging.WARNING
+    else:
+        level = os.environ.get("LOGLEVEL", "WARNING").upper()
+    logging.basicConfig(level=level, format="%(message)s")
+    
+    if args.cmd == "demo":
+        example_usage.main()
+    else:
+        find_limits.main()
+
+
+if __name__ == "__main__":
+    main()
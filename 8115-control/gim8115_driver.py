@@ -3,16 +3,31 @@ GIM8115 Motor Driver for SocketCAN (Linux)
 Implements SteadyWin GIM Protocol Specification
 """
 
+import asyncio
 import struct
 import time
 import can
 import json
 import os
+import queue
+import selectors
+import socket
 import threading
+import functools
+import collections
+from array import array
+import logging
 from dataclasses import dataclass
-from typing import Optional, Callable
+from typing import AsyncIterator, Optional, Callable, Sequence, Union
 import math
 
+try:
+    import orjson  # Optional: faster config (de)serialization
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
 
 # Command codes
 CMD_START_MOTOR = 0x91
@@ -58,6 +73,9 @@ RESULT_CODE_NAMES = {
     RES_FAIL_NOT_CONNECTED: "Not Connected",
 }
 
+# Result code descriptions indexed directly by code byte (None = unknown code)
+_RESULT_CODE_TABLE = tuple(RESULT_CODE_NAMES.get(code) for code in range(0x100))
+
 # Safety CAN ID and status codes
 CAN_ID_SAFETY = 0x005
 SAFETY_DEVICE_1 = 0x01
@@ -66,9 +84,174 @@ SAFETY_STATUS_MAX_LIMIT = 0x20  # Border limit2 (hard stop)
 SAFETY_STATUS_LIMIT1_FIND = 0x11  # Safety limit1 (approaching, used for limit finding)
 SAFETY_STATUS_LIMIT2_FIND = 0x12  # Safety limit2 (approaching, used for limit finding)
 
+# Angle conversion factors (one multiply instead of a math.degrees()/math.radians() call)
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
 # Safety limit shift: ±5 degrees added to found limits
 SAFETY_LIMIT_SHIFT_DEG = 5.0
-SAFETY_LIMIT_SHIFT_RAD = math.radians(SAFETY_LIMIT_SHIFT_DEG)
+SAFETY_LIMIT_SHIFT_RAD = SAFETY_LIMIT_SHIFT_DEG * _DEG2RAD
+
+# Default position limits: +/- 60 degrees from zero position
+_DEFAULT_LIMIT_RAD = 60.0 * _DEG2RAD
+
+# Persisted settings: (config file key, driver attribute, default when the key is missing)
+_CONFIG_FIELDS = (
+    ('position_offset', '_position_offset', 0.0),
+    ('position_min_limit', '_position_min_limit', -_DEFAULT_LIMIT_RAD),
+    ('position_max_limit', '_position_max_limit', _DEFAULT_LIMIT_RAD),
+    ('position_limits_enabled', '_position_limits_enabled', True),
+    ('position_border_min_limit', '_position_border_min_limit', None),  # Omitted from file while None
+    ('position_border_max_limit', '_position_border_max_limit', None),
+    ('limit_find_speed_rads', '_limit_find_speed_rads', 0.5),  # 0.5 rad/s = ~28.6 deg/s
+)
+
+# Real-time scheduling defaults for control scripts
+RT_CPU_CORE = 3  # Isolate with kernel boot args: isolcpus=3 nohz_full=3 rcu_nocbs=3
+RT_PRIORITY = 80
+
+# Precompiled frame layouts (little-endian, 8 bytes each)
+# Control command: cmd, float value, duration bits 0-15, duration bits 16-23
+_CONTROL_FRAME = struct.Struct('<BfHB')
+# Retrieve Indicator reply: cmd echo, indicator ID, result code, reserved, float value
+_INDICATOR_REPLY = struct.Struct('<BBBxf')
+# Feedback: cmd echo, result code, temperature (int8), position (uint16), speed/torque bytes ST0-ST2
+_FEEDBACK_FRAME = struct.Struct('<BBbHBBB')
+# Static command payloads (command byte followed by 7 zero bytes)
+_FRAME_START_MOTOR = bytes((CMD_START_MOTOR, 0, 0, 0, 0, 0, 0, 0))
+_FRAME_STOP_MOTOR = bytes((CMD_STOP_MOTOR, 0, 0, 0, 0, 0, 0, 0))
+_FRAME_REFRESH_CONFIGURATION = bytes((CMD_REFRESH_CONFIGURATION, 0, 0, 0, 0, 0, 0, 0))
+
+# Raw SocketCAN frame (struct can_frame): can_id, data length, 3 padding bytes, 8 data bytes
+_CAN_FRAME = struct.Struct('=IB3x8s')
+_CAN_FRAME_ID = struct.Struct('=I')
+_CAN_FRAME_DLC_OFFSET = 4
+_CAN_FRAME_DATA_OFFSET = 8
+# Kernel receive timestamp on the raw receive socket (struct timespec ancillary data)
+_SO_TIMESTAMPNS = getattr(socket, 'SO_TIMESTAMPNS', 35)
+_TIMESPEC = struct.Struct('@ll')
+_TIMESTAMP_CMSG_SIZE = socket.CMSG_SPACE(_TIMESPEC.size)
+# Kernel-side filter (struct can_filter): standard-ID data frames only (safety frames and
+# motor replies; the motor may answer on a different ID than the one it is addressed on)
+_RX_FILTER = struct.pack('=II', 0, socket.CAN_EFF_FLAG | socket.CAN_RTR_FLAG)
+
+
+def _can_id_filter(can_id: int) -> bytes:
+    """Kernel-side filter (struct can_filter) matching standard data frames with exactly this ID"""
+    return struct.pack('=II', can_id, socket.CAN_EFF_FLAG | socket.CAN_RTR_FLAG | socket.CAN_SFF_MASK)
+
+
+def _put_latest(q: queue.Queue, item) -> None:
+    """Put an item without blocking, discarding the oldest entries if the queue is full"""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _drain(q: queue.Queue) -> None:
+    """Discard everything currently in a queue"""
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> dict:
+    """
+    Read and parse a JSON config file (memoized on path and modification time)
+    
+    Args:
+        path: Config file path
+        mtime_ns: File modification time in nanoseconds (cache key only)
+    
+    Returns:
+        Parsed config dictionary (shared between callers, do not modify)
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+# Feedback decode constants (raw field -> physical unit), folded once at import instead of
+# dividing per frame: value = raw * SCALE + BIAS
+_POS_SCALE = 25.0 / 65535.0
+_POS_BIAS = -12.5
+_SPEED_SCALE = 130.0 / 4095.0
+_SPEED_BIAS = -65.0
+_TORQUE_SCALE = 450.0 / 4095.0
+_TORQUE_BIAS = -225.0
+
+
+def _decode_feedback(pos_uint16: int, st0: int, st1: int, st2: int) -> tuple[float, float, float]:
+    """
+    Scale the raw feedback fields to physical units
+    
+    Pure integer/float arithmetic with no Python objects involved, so it maps
+    one-to-one onto a C++ (or JIT-compiled) implementation.
+    
+    Args:
+        pos_uint16: Position field (bytes 3-4)
+        st0, st1, st2: Packed speed/torque bytes (bytes 5-7)
+    
+    Returns:
+        Tuple of (position_rad, speed_rads, torque_raw in Amperes)
+    """
+    # Decode position: pos_rad = (uint16_pos * 25.0 / 65535.0) - 12.5
+    position_rad = pos_uint16 * _POS_SCALE + _POS_BIAS
+    
+    # Speed & Torque (compressed 12-bit values)
+    # Speed: ST0 (byte 5) is High 8 bits. ST1 bits [7:4] (byte 6, upper 4 bits) are Low 4 bits.
+    speed_int = (st0 << 4) | ((st1 & 0xF0) >> 4)
+    # Decode speed: speed_rads = (speed_int * 130.0 / 4095.0) - 65.0
+    speed_rads = speed_int * _SPEED_SCALE + _SPEED_BIAS
+    
+    # Torque: ST1[3:0] (byte 6, lower 4 bits) is high 4 bits, ST2 (byte 7) is low 8 bits
+    torque_int = ((st1 & 0x0F) << 8) | st2
+    # Decode torque: torque_raw = (torque_int * 450.0 / 4095.0) - 225.0 (in Amperes)
+    torque_raw = torque_int * _TORQUE_SCALE + _TORQUE_BIAS
+    
+    return (position_rad, speed_rads, torque_raw)
+
+
+def set_realtime_scheduling(cpu_core: Optional[int] = RT_CPU_CORE, priority: int = RT_PRIORITY) -> bool:
+    """
+    Pin the calling thread to a CPU core and switch it to SCHED_FIFO
+
+    Threads started afterwards (safety listener, status monitor) inherit the affinity.
+    SCHED_FIFO requires root, CAP_SYS_NICE or an rtprio entry in /etc/security/limits.conf
+    (e.g. "@realtime - rtprio 99").
+
+    Args:
+        cpu_core: CPU core to pin to, or None to keep the current affinity
+        priority: SCHED_FIFO priority (1-99)
+
+    Returns:
+        True if SCHED_FIFO was applied, False if not permitted or not supported (the
+        affinity is then left unchanged)
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except (OSError, AttributeError):
+        return False  # Keep normal scheduling and the current affinity
+    
+    # Pin only once SCHED_FIFO is in place: a pinned thread at normal priority would just
+    # compete for one core
+    if cpu_core is not None:
+        try:
+            os.sched_setaffinity(0, {cpu_core})
+        except (OSError, AttributeError):
+            pass  # Core not available on this machine, keep default affinity
+    return True
 
 
 class GIM8115Error(Exception):
@@ -80,16 +263,14 @@ class GIM8115ResultError(GIM8115Error):
     """Exception raised when motor returns non-success result code"""
     def __init__(self, result_code: int, message: str = ""):
         self.result_code = result_code
-        self.message = message or RESULT_CODE_NAMES.get(result_code, f"Unknown error code: 0x{result_code:02X}")
+        name = _RESULT_CODE_TABLE[result_code] if 0 <= result_code < len(_RESULT_CODE_TABLE) else None
+        self.message = message or name or f"Unknown error code: 0x{result_code:02X}"
         super().__init__(f"Motor error: {self.message} (0x{result_code:02X})")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MotorStatus:
-    """Motor status feedback data"""
-    __slots__ = ('command_echo', 'result_code', 'temperature', 'position_rad', 
-                 'speed_rads', 'torque_nm', 'torque_raw')
-    
+    """Motor status feedback data (immutable, safe to hand to other threads)"""
     command_echo: int
     result_code: int
     temperature: int  # int8, in Celsius
@@ -112,6 +293,7 @@ class GIM8115Driver:
     
     # Frame size is always 8 bytes
     FRAME_SIZE = 8
+    _ZERO_FRAME = bytes(FRAME_SIZE)
     
     def __init__(
         self,
@@ -120,7 +302,8 @@ class GIM8115Driver:
         bitrate: int = 500000,
         torque_constant: float = 1.0,
         gear_ratio: float = 1.0,
-        config_file: str = "gim8115_config.json"
+        config_file: str = "gim8115_config.json",
+        reply_can_id: Optional[int] = None
     ):
         """
         Initialize GIM8115 driver
@@ -132,6 +315,9 @@ class GIM8115Driver:
             torque_constant: Motor torque constant KT (N⋅m/A)
             gear_ratio: Gear ratio (output/input)
             config_file: Path to configuration file for storing offset (default: "gim8115_config.json")
+            reply_can_id: CAN ID the motor replies on. If set, the kernel only delivers this ID and
+                          the safety ID (0x005), so other traffic on a shared bus never wakes Python.
+                          None (default) accepts replies on any standard ID.
         """
         self.interface = interface
         self.can_id = can_id
@@ -139,23 +325,66 @@ class GIM8115Driver:
         self.torque_constant = torque_constant
         self.gear_ratio = gear_ratio
         self.config_file = config_file
+        # Output torque per motor Ampere (KT * GEAR), computed once instead of per feedback frame
+        self._torque_nm_per_amp: float = torque_constant * gear_ratio
+        self.reply_can_id = reply_can_id
         
         # Pre-allocate buffers (no dynamic allocation in loops)
         self._tx_buffer = bytearray(self.FRAME_SIZE)
         self._rx_buffer = bytearray(self.FRAME_SIZE)
+        # Reused for every command: python-can keeps a bytearray as Message.data without
+        # copying, so packing into _tx_buffer updates the message in place
+        self._tx_msg = can.Message(
+            arbitration_id=self.can_id,
+            data=self._tx_buffer,
+            is_extended_id=False
+        )
+        # Held from packing _tx_buffer until _tx_msg is sent, since python-can reads the live
+        # buffer and the status monitor / receive threads send commands too (reentrant so
+        # _send_frame() can be called with it held)
+        self._tx_lock = threading.RLock()
+        # Fixed commands are sent from their own prebuilt messages; this also lets the safety
+        # path stop the motor without touching _tx_buffer while another thread is packing it
+        self._start_msg = can.Message(arbitration_id=self.can_id, data=_FRAME_START_MOTOR, is_extended_id=False)
+        self._stop_msg = can.Message(arbitration_id=self.can_id, data=_FRAME_STOP_MOTOR, is_extended_id=False)
+        self._refresh_msg = can.Message(
+            arbitration_id=self.can_id,
+            data=_FRAME_REFRESH_CONFIGURATION,
+            is_extended_id=False
+        )
         
         # CAN bus interface
         self._bus: Optional[can.Bus] = None
         
+        # Receive path: one raw SocketCAN socket read by a single thread that routes frames by
+        # CAN ID (safety frames -> _safety_queue, motor replies -> _reply_queue), so no two
+        # readers ever compete for the same frame. The python-can bus is only used for sending.
+        self._rx_sock: Optional[socket.socket] = None
+        self._rx_frame = bytearray(_CAN_FRAME.size)
+        self._rx_view = memoryview(self._rx_frame)
+        self._rx_thread: Optional[threading.Thread] = None
+        self._rx_running: bool = False
+        self._rx_wakeup: Optional[tuple[socket.socket, socket.socket]] = None  # Wakes the receive thread's selector on disconnect
+        self._reply_queue: queue.Queue = queue.Queue(maxsize=256)  # (can_id, 8-byte payload)
+        # Replies that have a dedicated waiter are routed by their command echo (byte 0), so one
+        # round trip cannot consume another's reply (e.g. a status poll eating a stop ack)
+        self._indicator_replies: queue.Queue = queue.Queue(maxsize=64)
+        self._stop_replies: queue.Queue = queue.Queue(maxsize=16)
+        self._reply_routes: dict[int, queue.Queue] = {
+            CMD_RETRIEVE_INDICATOR: self._indicator_replies,
+            CMD_STOP_MOTOR: self._stop_replies,
+        }
+        # Serializes indicator request/reply round trips (status monitor vs. ping and other calls)
+        self._indicator_lock = threading.Lock()
+        self._safety_queue: queue.Queue = queue.Queue(maxsize=64)  # (device_id, status)
+        
         # Position offset (loaded from config file)
         self._position_offset: float = 0.0
         
         # Position limits (relative to offset/zero position)
         # Default: +/- 60 degrees from zero position
-        DEFAULT_LIMIT_DEG = 60.0
-        DEFAULT_LIMIT_RAD = math.radians(DEFAULT_LIMIT_DEG)
-        self._position_min_limit: float = -DEFAULT_LIMIT_RAD
-        self._position_max_limit: float = DEFAULT_LIMIT_RAD
+        self._position_min_limit: float = -_DEFAULT_LIMIT_RAD
+        self._position_max_limit: float = _DEFAULT_LIMIT_RAD
         self._position_limits_enabled: bool = True
         
         # Position border limits (relative to offset/zero position)
@@ -166,78 +395,89 @@ class GIM8115Driver:
         # Limit finding speed (rad/s)
         self._limit_find_speed_rads: float = 0.5  # Default: 0.5 rad/s = ~28.6 deg/s
         
+        # Set by setters; changes are written once by flush_config() (called on disconnect)
+        self._config_dirty: bool = False
+        
         self.load_config()
         
-        # Safety listener state
-        self._safety_listener_thread: Optional[threading.Thread] = None
+        # Safety listener state (safety frames are handled on the receive thread)
         self._safety_listener_running: bool = False
         self._safety_callback: Optional[Callable[[int, int], None]] = None
         self._auto_stop_on_limit: bool = True  # Automatically stop motor on limit trigger
+        self._last_safety_timestamp: Optional[float] = None  # Kernel RX time of last safety frame
         
         # Status monitoring state
         self._status_monitor_thread: Optional[threading.Thread] = None
         self._status_monitor_running: bool = False
         self._status_callback: Optional[Callable[[MotorStatus], None]] = None
         self._status_monitor_rate: float = 10.0  # Hz (10 times per second)
+        # Statuses are handed to a separate dispatcher thread so a slow callback cannot delay polling.
+        # deque append/popleft are atomic, so no lock is needed; the oldest entries drop when full.
+        self._status_queue: collections.deque = collections.deque(maxlen=128)
+        self._status_ready = threading.Event()
+        self._status_stop = threading.Event()  # Wakes the monitor thread from its wait on stop
+        self._status_dispatch_thread: Optional[threading.Thread] = None
         
     def load_config(self) -> None:
         """
         Load configuration from file (position offset and limits)
         """
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    self._position_offset = config.get('position_offset', 0.0)
-                    
-                    # Load position limits (in radians)
-                    if 'position_min_limit' in config:
-                        self._position_min_limit = config['position_min_limit']
-                    if 'position_max_limit' in config:
-                        self._position_max_limit = config['position_max_limit']
-                    if 'position_limits_enabled' in config:
-                        self._position_limits_enabled = config['position_limits_enabled']
-                    
-                    # Load position border limits (in radians)
-                    if 'position_border_min_limit' in config:
-                        self._position_border_min_limit = config['position_border_min_limit']
-                    if 'position_border_max_limit' in config:
-                        self._position_border_max_limit = config['position_border_max_limit']
-                    
-                    # Load limit finding speed
-                    if 'limit_find_speed_rads' in config:
-                        self._limit_find_speed_rads = config['limit_find_speed_rads']
-            except (json.JSONDecodeError, IOError) as e:
-                # If config file is corrupted, use defaults
-                self._position_offset = 0.0
-        else:
+        # EAFP: a missing file surfaces as FileNotFoundError from the stat() below instead
+        # of a separate exists() check (one syscall fewer, no check-then-open race)
+        try:
+            # Parsed contents are cached per modification time, so re-loading an
+            # unchanged file does not touch the disk again
+            config = _read_config_file(self.config_file, os.stat(self.config_file).st_mtime_ns)
+        except FileNotFoundError:
             # Config file doesn't exist, use defaults
-            self._position_offset = 0.0
+            config = {}
+        except (json.JSONDecodeError, OSError):
+            # If config file is corrupted, use defaults
+            config = {}
+        
+        # Keys missing from the file fall back to their defaults
+        for key, attr, default in _CONFIG_FIELDS:
+            setattr(self, attr, config.get(key, default))
             
     def save_config(self) -> None:
         """
         Save configuration to file (position offset and limits)
         """
+        # Border limits are only written once they are set (None values are skipped)
         config = {
-            'position_offset': self._position_offset,
-            'position_min_limit': self._position_min_limit,
-            'position_max_limit': self._position_max_limit,
-            'position_limits_enabled': self._position_limits_enabled,
-            'limit_find_speed_rads': self._limit_find_speed_rads,
-            'can_id': self.can_id,
-            'interface': self.interface
+            key: value
+            for key, attr, _ in _CONFIG_FIELDS
+            if (value := getattr(self, attr)) is not None
         }
-        # Add border limits if they are set
-        if self._position_border_min_limit is not None:
-            config['position_border_min_limit'] = self._position_border_min_limit
-        if self._position_border_max_limit is not None:
-            config['position_border_max_limit'] = self._position_border_max_limit
+        config['can_id'] = self.can_id
+        config['interface'] = self.interface
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            if orjson is not None:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_file, 'w') as f:
+                    json.dump(config, f, indent=2)
         except IOError as e:
             raise GIM8115Error(f"Failed to save config file: {e}") from e
+        self._config_dirty = False
+    
+    def flush_config(self) -> None:
+        """
+        Write pending configuration changes to file
+        
+        Limit and speed setters only update the in-memory values, so several changes in a
+        row cost a single write (the position offset is saved immediately). Called
+        automatically by disconnect() and on context manager exit.
+        """
+        if self._config_dirty:
+            self.save_config()
             
+    @property
+    def position_offset(self) -> float:
+        """Position offset in radians (read-only attribute form of get_position_offset())"""
+        return self._position_offset
+    
     def get_position_offset(self) -> float:
         """
         Get the current position offset
@@ -255,8 +495,14 @@ class GIM8115Driver:
             offset_rad: Position offset in radians
         """
         self._position_offset = offset_rad
+        # Calibration is written immediately (not deferred to flush_config()) so it survives a crash
         self.save_config()
     
+    @property
+    def position_limits(self) -> tuple[float, float]:
+        """(min_limit, max_limit) in radians (read-only attribute form of get_position_limits())"""
+        return (self._position_min_limit, self._position_max_limit)
+    
     def get_position_limits(self) -> tuple[float, float]:
         """
         Get current position limits (left/right) - safety limits after shift
@@ -292,7 +538,7 @@ class GIM8115Driver:
             raise GIM8115Error("Minimum limit must be less than maximum limit")
         self._position_min_limit = min_limit_rad
         self._position_max_limit = max_limit_rad
-        self.save_config()
+        self._config_dirty = True
     
     def set_position_limits_degrees(self, min_limit_deg: float, max_limit_deg: float) -> None:
         """
@@ -302,7 +548,7 @@ class GIM8115Driver:
             min_limit_deg: Minimum position (left limit) in degrees (negative value)
             max_limit_deg: Maximum position (right limit) in degrees (positive value)
         """
-        self.set_position_limits(math.radians(min_limit_deg), math.radians(max_limit_deg))
+        self.set_position_limits(min_limit_deg * _DEG2RAD, max_limit_deg * _DEG2RAD)
     
     def enable_position_limits(self, enabled: bool = True) -> None:
         """
@@ -312,7 +558,12 @@ class GIM8115Driver:
             enabled: True to enable limits, False to disable
         """
         self._position_limits_enabled = enabled
-        self.save_config()
+        self._config_dirty = True
+    
+    @property
+    def position_limits_enabled(self) -> bool:
+        """True if position limits are enforced (read-only attribute form of is_position_limits_enabled())"""
+        return self._position_limits_enabled
     
     def is_position_limits_enabled(self) -> bool:
         """
@@ -357,6 +608,11 @@ class GIM8115Driver:
         
         return False  # Already within limits
     
+    @property
+    def limit_find_speed(self) -> float:
+        """Limit finding speed in rad/s (read-only attribute form of get_limit_find_speed())"""
+        return self._limit_find_speed_rads
+    
     def get_limit_find_speed(self) -> float:
         """
         Get the configured rotation speed for limit finding
@@ -376,13 +632,14 @@ class GIM8115Driver:
         if speed_rads <= 0:
             raise GIM8115Error("Limit find speed must be positive")
         self._limit_find_speed_rads = speed_rads
-        self.save_config()
+        self._config_dirty = True
     
     def find_position_limits(
         self,
         speed_rads: Optional[float] = None,
         timeout_seconds: float = 60.0,
-        check_interval: float = 0.05
+        check_interval: Optional[float] = None,
+        abort: Optional[threading.Event] = None
     ) -> tuple[float, float]:
         """
         Automatically find position limits by rotating until limit events are detected
@@ -397,17 +654,24 @@ class GIM8115Driver:
         Args:
             speed_rads: Rotation speed in rad/s (default: uses configured limit_find_speed_rads from config)
             timeout_seconds: Maximum time to wait for each limit (default: 60 seconds)
-            check_interval: Interval to check for safety messages (default: 0.05 seconds = 20 Hz)
+            check_interval: Optional cap on each wait for a safety message, in seconds. By default
+                            (None) the loop blocks on the safety queue (fed by the receive thread) until
+                            a frame arrives or the next progress message / timeout is due, so it
+                            only wakes up on events.
+            abort: Optional event checked after every wait; once set, the motor is stopped and
+                   GIM8115Error is raised (a safety queue entry wakes a waiting search early)
             
         Returns:
             Tuple of (min_limit, max_limit) in radians relative to zero position
             
         Raises:
-            GIM8115Error: If motor is not started, connection issues, or timeout
+            GIM8115Error: If motor is not started, connection issues, timeout, a border limit
+                          (0x10/0x20) is reached before the matching safety limit, or abort is set
         """
         # Use configured speed if not specified
         if speed_rads is None:
             speed_rads = self._limit_find_speed_rads
+        speed_deg = speed_rads * _RAD2DEG  # Loop-invariant, used in progress messages
         if self._bus is None:
             raise GIM8115Error("Not connected to CAN bus. Call connect() first.")
         
@@ -415,14 +679,6 @@ class GIM8115Driver:
         limits_were_enabled = self._position_limits_enabled
         self._position_limits_enabled = False
         
-        # Temporarily stop safety listener to avoid race condition with CAN bus reading
-        # Both the listener thread and limit finding code would try to read from CAN bus
-        safety_listener_was_running = self._safety_listener_running
-        if safety_listener_was_running:
-            print("Temporarily stopping safety listener during limit finding...")
-            self.stop_safety_listener()
-            time.sleep(0.1)  # Give thread time to stop
-        
         try:
             # Ensure motor is started
             self.start_motor()            
@@ -431,60 +687,72 @@ class GIM8115Driver:
             max_limit_abs: Optional[float] = None
             
             # Step 1: Find safety limit1 (rotate negative/left)
-            # Look for STATUS_LIMIT1_FIND (0x11), ignore border limits (0x10)
-            print("Finding safety limit1 (rotating left, looking for 0x11)...")
-            print(f"  Motor should be rotating left at {math.degrees(speed_rads):.1f}°/s")
-            print(f"  Waiting for CAN message 0x005 [0x01, 0x11]...")
+            # Look for STATUS_LIMIT1_FIND (0x11); a border limit (0x10) aborts the search
+            log.info("Finding safety limit1 (rotating left, looking for 0x11)...")
+            log.info("  Motor should be rotating left at %.1f°/s", speed_deg)
+            log.info("  Waiting for CAN message 0x005 [0x01, 0x11]...")
+            _drain(self._safety_queue)  # Ignore safety frames received before the search
             self.send_velocity(-abs(speed_rads), duration_ms=0)  # Negative speed = left
             time.sleep(0.1)  # Give motor time to start
             
-            start_time = time.time()
-            last_status_time = start_time
-            while (time.time() - start_time) < timeout_seconds:
+            # One monotonic clock read per iteration (immune to wall-clock jumps)
+            start_time = time.monotonic()
+            deadline = start_time + timeout_seconds
+            next_status_time = start_time + 5.0
+            now = start_time
+            while now < deadline:
                 # Check for safety message
-                result = self.check_safety_message(timeout=check_interval)
+                # Block on the safety queue until a safety frame arrives or the next progress/timeout check is due
+                wait = min(next_status_time, deadline) - now
+                if check_interval is not None:
+                    wait = min(wait, check_interval)
+                result = self.check_safety_message(timeout=max(0.0, wait))
+                now = time.monotonic()
+                if abort is not None and abort.is_set():
+                    raise GIM8115Error("Limit search aborted")
                 if result is not None:
                     device_id, status = result
-                    elapsed = time.time() - start_time
-                    print(f"  Received CAN message: Device {device_id:02X}, Status {status:02X} (after {elapsed:.1f}s)")
+                    log.debug("  Received CAN message: Device %02X, Status %02X (after %.1fs)", device_id, status, now - start_time)
                     
-                    # Only use safety limit1 (0x11), ignore border limit (0x10)
+                    # Only safety limit1 (0x11) is used for the limit; border limit (0x10) aborts the search
                     if status == SAFETY_STATUS_LIMIT1_FIND:
                         # Safety limit1 detected, stop and record position
-                        print(f"  Safety limit1 (0x11) detected! Stopping motor and recording position...")
                         self.stop_motor()
+                        # Kernel RX timestamp (SO_TIMESTAMPNS) -> stop command sent
+                        stop_latency_ms = (time.time() - self._last_safety_timestamp) * 1000.0
+                        log.info("  Safety limit1 (0x11) detected! Motor stopped %.2f ms after frame arrival, recording position...", stop_latency_ms)
                         time.sleep(0.2)
                         
                         current_abs = self.get_current_position(timeout=1.0)
                         if current_abs is not None:
                             min_limit_abs = current_abs  # Store absolute position
                             min_limit_rel = current_abs - self._position_offset
-                            print(f"✓ Safety limit1 found at {math.degrees(min_limit_rel):.2f}° (abs: {min_limit_abs:.4f} rad)")
+                            log.info("✓ Safety limit1 found at %.2f° (abs: %.4f rad)", min_limit_rel * _RAD2DEG, min_limit_abs)
                             break
                         else:
-                            print(f"⚠️  Warning: Could not get current position after detecting limit1")
+                            log.warning("⚠️  Warning: Could not get current position after detecting limit1")
                             # Try again with longer timeout
                             time.sleep(0.5)
                             current_abs = self.get_current_position(timeout=2.0)
                             if current_abs is not None:
                                 min_limit_abs = current_abs
                                 min_limit_rel = current_abs - self._position_offset
-                                print(f"✓ Safety limit1 found at {math.degrees(min_limit_rel):.2f}° (abs: {min_limit_abs:.4f} rad) - retry successful")
+                                log.info("✓ Safety limit1 found at %.2f° (abs: %.4f rad) - retry successful", min_limit_rel * _RAD2DEG, min_limit_abs)
                                 break
                             else:
                                 raise GIM8115Error("Failed to get current position after detecting safety limit1 (0x11)")
                     elif status == SAFETY_STATUS_MIN_LIMIT:
-                        # Border limit reached - continue but don't use for limit finding
-                        print(f"⚠️  Border limit1 reached, continuing to find safety limit1...")
+                        # Border limit reached before the safety limit: the listener's auto-stop (or
+                        # the error handler below) stops the motor, so the search cannot continue
+                        raise GIM8115Error("Border limit1 (0x10) reached before safety limit1 (0x11) - motor stopped")
                 
                 # Print progress every 5 seconds
-                elapsed = time.time() - start_time
-                if elapsed - (last_status_time - start_time) >= 5.0:
-                    print(f"  Still searching... ({elapsed:.1f}s elapsed, waiting for 0x11)")
-                    last_status_time = time.time()
+                if now >= next_status_time:
+                    log.debug("  Still searching... (%.1fs elapsed, waiting for 0x11)", now - start_time)
+                    next_status_time = now + 5.0
                 
                 # Check timeout
-                if (time.time() - start_time) >= timeout_seconds:
+                if now >= deadline:
                     raise GIM8115Error("Timeout waiting for safety limit1 event (0x11)")
             
             if min_limit_abs is None:
@@ -492,63 +760,77 @@ class GIM8115Driver:
             
             # Small delay before reversing
             time.sleep(0.5)
+            if abort is not None and abort.is_set():
+                raise GIM8115Error("Limit search aborted")
             
             # Step 2: Find safety limit2 (rotate positive/right)
-            # Look for STATUS_LIMIT2_FIND (0x12), ignore border limits (0x20)
-            print("Finding safety limit2 (rotating right, looking for 0x12)...")
-            print(f"  Motor should be rotating right at {math.degrees(speed_rads):.1f}°/s")
-            print(f"  Waiting for CAN message 0x005 [0x01, 0x12]...")
+            # Look for STATUS_LIMIT2_FIND (0x12); a border limit (0x20) aborts the search
+            log.info("Finding safety limit2 (rotating right, looking for 0x12)...")
+            log.info("  Motor should be rotating right at %.1f°/s", speed_deg)
+            log.info("  Waiting for CAN message 0x005 [0x01, 0x12]...")
             self.start_motor()            
             time.sleep(0.1)  # Give motor time to start
+            _drain(self._safety_queue)  # Ignore safety frames received before the search
             self.send_velocity(abs(speed_rads), duration_ms=0)  # Positive speed = right
             
-            start_time = time.time()
-            last_status_time = start_time
-            while (time.time() - start_time) < timeout_seconds:
+            # One monotonic clock read per iteration (immune to wall-clock jumps)
+            start_time = time.monotonic()
+            deadline = start_time + timeout_seconds
+            next_status_time = start_time + 5.0
+            now = start_time
+            while now < deadline:
                 # Check for safety message
-                result = self.check_safety_message(timeout=check_interval)
+                # Block on the safety queue until a safety frame arrives or the next progress/timeout check is due
+                wait = min(next_status_time, deadline) - now
+                if check_interval is not None:
+                    wait = min(wait, check_interval)
+                result = self.check_safety_message(timeout=max(0.0, wait))
+                now = time.monotonic()
+                if abort is not None and abort.is_set():
+                    raise GIM8115Error("Limit search aborted")
                 if result is not None:
                     device_id, status = result
-                    elapsed = time.time() - start_time
-                    print(f"  Received CAN message: Device {device_id:02X}, Status {status:02X} (after {elapsed:.1f}s)")
+                    log.debug("  Received CAN message: Device %02X, Status %02X (after %.1fs)", device_id, status, now - start_time)
                     
-                    # Only use safety limit2 (0x12), ignore border limit (0x20)
+                    # Only safety limit2 (0x12) is used for the limit; border limit (0x20) aborts the search
                     if status == SAFETY_STATUS_LIMIT2_FIND:
                         # Safety limit2 detected, stop and record position
-                        print(f"  Safety limit2 (0x12) detected! Stopping motor and recording position...")
                         self.stop_motor()
+                        # Kernel RX timestamp (SO_TIMESTAMPNS) -> stop command sent
+                        stop_latency_ms = (time.time() - self._last_safety_timestamp) * 1000.0
+                        log.info("  Safety limit2 (0x12) detected! Motor stopped %.2f ms after frame arrival, recording position...", stop_latency_ms)
                         time.sleep(0.2)
                         
                         current_abs = self.get_current_position(timeout=1.0)
                         if current_abs is not None:
                             max_limit_abs = current_abs  # Store absolute position
                             max_limit_rel = current_abs - self._position_offset
-                            print(f"✓ Safety limit2 found at {math.degrees(max_limit_rel):.2f}° (abs: {max_limit_abs:.4f} rad)")
+                            log.info("✓ Safety limit2 found at %.2f° (abs: %.4f rad)", max_limit_rel * _RAD2DEG, max_limit_abs)
                             break
                         else:
-                            print(f"⚠️  Warning: Could not get current position after detecting limit2")
+                            log.warning("⚠️  Warning: Could not get current position after detecting limit2")
                             # Try again with longer timeout
                             time.sleep(0.5)
                             current_abs = self.get_current_position(timeout=2.0)
                             if current_abs is not None:
                                 max_limit_abs = current_abs
                                 max_limit_rel = current_abs - self._position_offset
-                                print(f"✓ Safety limit2 found at {math.degrees(max_limit_rel):.2f}° (abs: {max_limit_abs:.4f} rad) - retry successful")
+                                log.info("✓ Safety limit2 found at %.2f° (abs: %.4f rad) - retry successful", max_limit_rel * _RAD2DEG, max_limit_abs)
                                 break
                             else:
                                 raise GIM8115Error("Failed to get current position after detecting safety limit2 (0x12)")
                     elif status == SAFETY_STATUS_MAX_LIMIT:
-                        # Border limit reached - continue but don't use for limit finding
-                        print(f"⚠️  Border limit2 reached, continuing to find safety limit2...")
+                        # Border limit reached before the safety limit: the listener's auto-stop (or
+                        # the error handler below) stops the motor, so the search cannot continue
+                        raise GIM8115Error("Border limit2 (0x20) reached before safety limit2 (0x12) - motor stopped")
                 
                 # Print progress every 5 seconds
-                elapsed = time.time() - start_time
-                if elapsed - (last_status_time - start_time) >= 5.0:
-                    print(f"  Still searching... ({elapsed:.1f}s elapsed, waiting for 0x12)")
-                    last_status_time = time.time()
+                if now >= next_status_time:
+                    log.debug("  Still searching... (%.1fs elapsed, waiting for 0x12)", now - start_time)
+                    next_status_time = now + 5.0
                 
                 # Check timeout
-                if (time.time() - start_time) >= timeout_seconds:
+                if now >= deadline:
                     raise GIM8115Error("Timeout waiting for safety limit2 event (0x12)")
             
             if max_limit_abs is None:
@@ -588,16 +870,18 @@ class GIM8115Driver:
             self._position_border_max_limit = max_limit_abs - self._position_offset
             
             # Display results using new offset for relative positions
-            print(f"  Applying ±{SAFETY_LIMIT_SHIFT_DEG}° safety shift to border limits:")
-            print(f"    Border limit1 (0x11): {math.degrees(self._position_border_min_limit):.2f}° -> Safety limit: {math.degrees(self._position_min_limit):.2f}°")
-            print(f"    Border limit2 (0x12): {math.degrees(self._position_border_max_limit):.2f}° -> Safety limit: {math.degrees(self._position_max_limit):.2f}°")
+            log.info("  Applying ±%s° safety shift to border limits:", SAFETY_LIMIT_SHIFT_DEG)
+            log.info("    Border limit1 (0x11): %.2f° -> Safety limit: %.2f°", self._position_border_min_limit * _RAD2DEG, self._position_min_limit * _RAD2DEG)
+            log.info("    Border limit2 (0x12): %.2f° -> Safety limit: %.2f°", self._position_border_max_limit * _RAD2DEG, self._position_max_limit * _RAD2DEG)
             
             # Restore position limits state
             self._position_limits_enabled = limits_were_enabled
+            if abort is not None and abort.is_set():
+                raise GIM8115Error("Limit search aborted")
             
             # Move motor to center position (safe position within new limits)
             # This ensures the motor is at a valid position after limit finding
-            print("Moving motor to center position (safe position within new limits)...")
+            log.info("Moving motor to center position (safe position within new limits)...")
             center_position = 0.0  # Center is now at zero (relative to new offset)
             try:
                 self.start_motor()
@@ -605,21 +889,15 @@ class GIM8115Driver:
                 self.send_position(center_position, duration_ms=100)  # Move to center over 2 seconds
                 time.sleep(2.5)  # Wait for movement to complete
                 self.stop_motor()
-                print("✓ Motor moved to center position")
+                log.info("✓ Motor moved to center position")
             except Exception as e:
-                print(f"⚠️  Warning: Could not move motor to center: {e}")
+                log.warning("⚠️  Warning: Could not move motor to center: %s", e)
                 # Continue anyway - motor is already stopped
             
             self.save_config()
             
-            print(f"✓ Limits set: Min={math.degrees(self._position_min_limit):.2f}°, Max={math.degrees(self._position_max_limit):.2f}°")
-            print(f"✓ Zero position set to center: offset={self._position_offset:.4f} rad")
-            
-            # Restore safety listener after successful completion
-            if safety_listener_was_running:
-                print("Restarting safety listener...")
-                self.start_safety_listener(auto_stop=True)
-                time.sleep(0.1)  # Give thread time to start
+            log.info("✓ Limits set: Min=%.2f°, Max=%.2f°", self._position_min_limit * _RAD2DEG, self._position_max_limit * _RAD2DEG)
+            log.info("✓ Zero position set to center: offset=%.4f rad", self._position_offset)
             
             return (self._position_min_limit, self._position_max_limit)
             
@@ -631,16 +909,75 @@ class GIM8115Driver:
                 pass
             # Restore limits state
             self._position_limits_enabled = limits_were_enabled
-            # Restore safety listener on error too
-            if safety_listener_was_running:
-                print("Restarting safety listener after error...")
-                try:
-                    self.start_safety_listener(auto_stop=True)
-                    time.sleep(0.1)  # Give thread time to start
-                except Exception as listener_error:
-                    print(f"⚠️  Warning: Could not restart safety listener: {listener_error}")
             raise GIM8115Error(f"Error finding limits: {e}") from e
         
+    async def find_position_limits_async(
+        self,
+        speed_rads: Optional[float] = None,
+        timeout_seconds: float = 60.0,
+        check_interval: Optional[float] = None
+    ) -> tuple[float, float]:
+        """
+        Asyncio entry point for find_position_limits()
+        
+        The search runs in a worker thread (asyncio.to_thread), where it blocks on the
+        safety queue fed by the receive thread, so the event loop stays responsive for the whole
+        (up to 2 x timeout_seconds) calibration. Arguments and result are the same as
+        find_position_limits().
+        
+        If the awaiting task is cancelled (e.g. asyncio.wait_for() timeout or Ctrl+C in
+        asyncio.run()), the motor is stopped immediately, the worker is told to abort (it
+        raises GIM8115Error in the thread without saving limits) and CancelledError is re-raised.
+        """
+        abort = threading.Event()
+        try:
+            return await asyncio.to_thread(
+                self.find_position_limits, speed_rads, timeout_seconds, check_interval, abort
+            )
+        except asyncio.CancelledError:
+            abort.set()
+            _put_latest(self._safety_queue, None)  # Wake the search from its safety wait
+            try:
+                self.stop_motor()
+            except GIM8115Error as e:
+                log.error("Failed to stop motor after cancelled limit search: %s", e)
+            raise
+    
+    async def iter_status(self, rate_hz: float = 10.0, timeout: float = 0.08) -> AsyncIterator[MotorStatus]:
+        """
+        Asyncio alternative to start_status_monitor(): poll motor status at rate_hz
+        
+        Use as `async for status in motor.iter_status(): ...`. Each poll runs
+        get_motor_status() in a worker thread (asyncio.to_thread), where it waits on the reply
+        queue fed by the receive thread, so the event loop stays free during and between polls.
+        Polls are paced against monotonic deadlines like the status monitor; polls without a
+        reply are skipped.
+        
+        Args:
+            rate_hz: Polling rate in Hz (default: 10.0)
+            timeout: Reply timeout per poll in seconds (default: 0.08)
+        
+        Returns:
+            Async iterator of MotorStatus, one per poll that got a reply
+        """
+        if self._bus is None:
+            raise GIM8115Error("Not connected to CAN bus. Call connect() first.")
+        
+        period = 1.0 / rate_hz
+        next_poll = time.monotonic()
+        
+        while True:
+            status = await asyncio.to_thread(self.get_motor_status, timeout)
+            if status is not None:
+                yield status
+            
+            next_poll += period
+            remaining = next_poll - time.monotonic()
+            if remaining > 0.0:
+                await asyncio.sleep(remaining)
+            else:
+                next_poll -= remaining  # Fell behind: restart the schedule instead of bursting
+    
     def __enter__(self):
         """Context manager entry"""
         self.connect()
@@ -650,7 +987,13 @@ class GIM8115Driver:
         """Context manager exit"""
         self.stop_safety_listener()
         self.stop_status_monitor()
-        self.disconnect()
+        try:
+            self.disconnect()
+        except GIM8115Error as e:
+            if exc_type is None:
+                raise
+            # Don't hide the exception that ended the with block
+            log.error("Failed to save configuration on disconnect: %s", e)
         
     def connect(self) -> None:
         """Connect to CAN bus"""
@@ -665,51 +1008,132 @@ class GIM8115Driver:
             )
         except Exception as e:
             raise GIM8115Error(f"Failed to connect to CAN bus {self.interface}: {e}") from e
-            
-    def disconnect(self) -> None:
-        """Disconnect from CAN bus"""
-        if self._bus is not None:
+        
+        # All frames are received on one raw socket (no python-can Message per frame) and
+        # routed by the receive thread
+        try:
+            sock = socket.socket(socket.AF_CAN, socket.SOCK_RAW, socket.CAN_RAW)
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, _SO_TIMESTAMPNS, 1)
+                sock.setsockopt(socket.SOL_CAN_RAW, socket.CAN_RAW_FILTER, self._rx_filter())
+                sock.bind((self.interface,))
+            except OSError:
+                sock.close()
+                raise
+        except OSError as e:
             self._bus.shutdown()
             self._bus = None
+            raise GIM8115Error(f"Failed to open receive socket on {self.interface}: {e}") from e
+        self._rx_sock = sock
+        
+        # python-can's own socket is only used for sending: an empty filter list stops
+        # the kernel from queueing received frames on it
+        try:
+            self._bus.socket.setsockopt(socket.SOL_CAN_RAW, socket.CAN_RAW_FILTER, b"")
+        except (AttributeError, OSError):
+            pass
+        
+        _drain(self._reply_queue)
+        for replies in self._reply_routes.values():
+            _drain(replies)
+        _drain(self._safety_queue)
+        self._rx_wakeup = socket.socketpair()
+        self._rx_running = True
+        self._rx_thread = threading.Thread(
+            target=self._rx_loop,
+            daemon=True,
+            name="CANReceive"
+        )
+        self._rx_thread.start()
             
-    def _send_frame(self, payload: bytes) -> None:
+    def _rx_filter(self) -> bytes:
+        """Kernel-side filter list for the receive socket (reply ID + safety ID when the reply ID is known)"""
+        if self.reply_can_id is None:
+            return _RX_FILTER
+        return _can_id_filter(self.reply_can_id) + _can_id_filter(CAN_ID_SAFETY)
+    
+    def disconnect(self) -> None:
+        """
+        Disconnect from CAN bus (pending configuration changes are saved first)
+        
+        The receive thread, sockets and bus are released even if saving fails; the
+        GIM8115Error from save_config() is raised afterwards.
+        """
+        try:
+            self.flush_config()
+        finally:
+            if self._rx_thread is not None:
+                self._rx_running = False
+                self._rx_wakeup[1].send(b"\x00")
+                self._rx_thread.join(timeout=1.0)
+                self._rx_thread = None
+            if self._rx_wakeup is not None:
+                for wakeup_sock in self._rx_wakeup:
+                    wakeup_sock.close()
+                self._rx_wakeup = None
+            if self._rx_sock is not None:
+                self._rx_sock.close()
+                self._rx_sock = None
+            if self._bus is not None:
+                self._bus.shutdown()
+                self._bus = None
+            
+    def _send_frame(self, payload: Optional[bytes] = None) -> None:
         """
         Send CAN frame
         
         Args:
-            payload: 8-byte payload
+            payload: 8-byte payload. If None, the frame already packed in _tx_buffer is sent
+                     (no copy and no new can.Message per command); the caller must hold
+                     _tx_lock from packing until this returns.
         """
         if self._bus is None:
             raise GIM8115Error("Not connected to CAN bus. Call connect() first.")
             
-        if len(payload) != self.FRAME_SIZE:
+        if payload is not None and len(payload) != self.FRAME_SIZE:
             raise GIM8115Error(f"Payload must be exactly {self.FRAME_SIZE} bytes")
-            
-        msg = can.Message(
-            arbitration_id=self.can_id,
-            data=payload,
-            is_extended_id=False
-        )
+        
+        with self._tx_lock:
+            if payload is not None:
+                self._tx_buffer[:] = payload
+            self._send_message(self._tx_msg)
+    
+    def _send_message(self, msg: can.Message) -> None:
+        """
+        Send a prebuilt CAN message
+        
+        Args:
+            msg: Message to send (reused between calls, never modified here)
+        """
+        if self._bus is None:
+            raise GIM8115Error("Not connected to CAN bus. Call connect() first.")
         
         try:
             self._bus.send(msg)
             # Debug: print sent frame (can be removed in production)
-            # print(f"Sent CAN ID 0x{self.can_id:02X}: {payload.hex()}")
+            # print(f"Sent CAN ID 0x{self.can_id:02X}: {msg.data.hex()}")
         except Exception as e:
             raise GIM8115Error(f"Failed to send CAN frame: {e}") from e
             
-    def _receive_frame(self, timeout: float = 1.0, filter_can_id: Optional[int] = None) -> Optional[bytes]:
+    def _receive_frame(
+        self,
+        timeout: float = 1.0,
+        filter_can_id: Optional[int] = None,
+        replies: Optional[queue.Queue] = None
+    ) -> Optional[bytes]:
         """
         Receive CAN frame from motor
         
         Args:
             timeout: Timeout in seconds
             filter_can_id: CAN ID to filter by. If None, uses self.can_id. If -1, accepts any ID.
+            replies: Reply queue to read (default: replies without a dedicated route, i.e. not
+                     indicator or stop replies)
             
         Returns:
             8-byte payload or None if timeout
         """
-        if self._bus is None:
+        if self._rx_sock is None:
             raise GIM8115Error("Not connected to CAN bus. Call connect() first.")
             
         # Determine which CAN ID to filter by
@@ -723,71 +1147,108 @@ class GIM8115Driver:
             # Filter by specified CAN ID
             target_can_id = filter_can_id
             
-        try:
-            start_time = time.time()
-            while (time.time() - start_time) < timeout:
-                msg = self._bus.recv(timeout=min(0.1, timeout - (time.time() - start_time)))
-                if msg is None:
-                    continue
-                # Filter by CAN ID if specified (some motors respond on different ID)
-                if target_can_id is not None and msg.arbitration_id != target_can_id:
-                    continue
-                if len(msg.data) != self.FRAME_SIZE:
-                    continue
-                return bytes(msg.data)
-            return None
-        except Exception as e:
-            raise GIM8115Error(f"Failed to receive CAN frame: {e}") from e
+        if replies is None:
+            replies = self._reply_queue
+        
+        # Replies are queued by the receive thread (8-byte frames only)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                can_id, payload = replies.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            # Filter by CAN ID if specified (some motors respond on different ID)
+            if target_can_id is None or can_id == target_can_id:
+                return payload
             
+    def _receive_command_reply(self, command: int, timeout: float) -> Optional[bytes]:
+        """
+        Wait for the motor's reply to a specific command, discarding unrelated frames
+        
+        Args:
+            command: Command byte expected as echo in byte 0 of the reply
+            timeout: Timeout in seconds
+        
+        Returns:
+            8-byte reply payload or None if timeout
+        """
+        replies = self._reply_routes.get(command, self._reply_queue)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # Accept any CAN ID - motor may respond on different ID
+            response = self._receive_frame(timeout=remaining, filter_can_id=-1, replies=replies)
+            if response is not None and response[0] == command:
+                return response
+    
+    def _receive_indicator_reply(self, indi_id: int, timeout: float) -> Optional[bytes]:
+        """
+        Wait for the reply to a Retrieve Indicator request, discarding unrelated frames
+        
+        Matching on both the command echo and the indicator ID means a late reply to an
+        earlier request (e.g. for another indicator) cannot be taken for this one.
+        
+        Args:
+            indi_id: Indicator ID expected in byte 1 of the reply
+            timeout: Timeout in seconds
+        
+        Returns:
+            8-byte reply payload or None if timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # Accept any CAN ID - motor may respond on different ID
+            response = self._receive_frame(timeout=remaining, filter_can_id=-1, replies=self._indicator_replies)
+            if response is not None and response[0] == CMD_RETRIEVE_INDICATOR and response[1] == indi_id:
+                return response
+    
     def _clear_tx_buffer(self) -> None:
         """Clear transmit buffer (set all bytes to 0x00)"""
-        for i in range(self.FRAME_SIZE):
-            self._tx_buffer[i] = 0x00
+        self._tx_buffer[:] = self._ZERO_FRAME
     
     def start_motor(self) -> None:
         """Start the motor"""
-        self._clear_tx_buffer()
-        self._tx_buffer[0] = CMD_START_MOTOR
-        self._send_frame(bytes(self._tx_buffer))
-        
-    def stop_motor(self) -> None:
-        """Stop the motor"""
-        self._clear_tx_buffer()
-        self._tx_buffer[0] = CMD_STOP_MOTOR
-        self._send_frame(bytes(self._tx_buffer))
+        self._send_message(self._start_msg)
         
-    def _clamp_position(self, angle_rad: float) -> float:
+    def stop_motor(self, ack_timeout: Optional[float] = None) -> None:
         """
-        Clamp position to limits if enabled
+        Stop the motor
         
         Args:
-            angle_rad: Target position in radians
-            
-        Returns:
-            Clamped position in radians
+            ack_timeout: If set, wait up to this many seconds for the motor's reply to the stop
+                         command instead of guessing a delay. None (default) sends without
+                         waiting, as used on the safety path.
+        
+        Raises:
+            GIM8115Error: If ack_timeout is set and no reply arrives in time
         """
-        if not self._position_limits_enabled:
-            return angle_rad
+        if ack_timeout is not None:
+            _drain(self._stop_replies)  # Replies to earlier stops (e.g. from the safety path)
+        self._send_message(self._stop_msg)
         
-        if angle_rad < self._position_min_limit:
-            return self._position_min_limit
-        elif angle_rad > self._position_max_limit:
-            return self._position_max_limit
+        if ack_timeout is not None and self._receive_command_reply(CMD_STOP_MOTOR, ack_timeout) is None:
+            raise GIM8115Error("Stop command not acknowledged by motor")
         
-        return angle_rad
-    
-    def _pack_duration(self, duration_ms: int) -> None:
+    def _pack_control(self, command: int, value: float, duration_ms: int) -> None:
         """
-        Pack duration (24-bit unsigned int) into bytes 5-7 of tx_buffer
+        Pack a control command (float value + 24-bit duration) into tx_buffer (hold _tx_lock)
         
         Args:
+            command: Control command code (CMD_POSITION_CONTROL, CMD_VELOCITY_CONTROL, CMD_TORQUE_CONTROL)
+            value: Target value written to bytes 1-4
             duration_ms: Total time from start to stop in milliseconds (acceleration + deceleration).
                         Example: 100ms = 50ms acceleration + 50ms deceleration.
         """
-        duration_bytes = struct.pack('<I', duration_ms & 0xFFFFFF)
-        self._tx_buffer[5] = duration_bytes[0]
-        self._tx_buffer[6] = duration_bytes[1]
-        self._tx_buffer[7] = duration_bytes[2]
+        duration_ms &= 0xFFFFFF
+        _CONTROL_FRAME.pack_into(self._tx_buffer, 0, command, value, duration_ms & 0xFFFF, duration_ms >> 16)
     
     def send_position(self, angle_rad: float, duration_ms: int = 0) -> None:
         """
@@ -803,19 +1264,115 @@ class GIM8115Driver:
             If position limits are enabled, the position will be clamped to the nearest limit.
             If command exceeds limits, motor will move to the limit position (cannot exceed min or max limits).
         """
-        # Clamp position to limits if enabled
-        angle_rad = self._clamp_position(angle_rad)
+        with self._tx_lock:
+            self._pack_position(angle_rad, duration_ms)
+            self._send_frame()
+    
+    def _pack_position(self, angle_rad: float, duration_ms: int) -> None:
+        """
+        Pack a position control frame into tx_buffer (applies limit clamping and position offset;
+        hold _tx_lock)
+        
+        Args:
+            angle_rad: Target position in radians (relative to calibrated zero)
+            duration_ms: Total time from start to stop in milliseconds
+        """
+        # Clamp position to limits if enabled (cannot exceed min or max limits)
+        if self._position_limits_enabled:
+            angle_rad = min(max(angle_rad, self._position_min_limit), self._position_max_limit)
         
         # Apply position offset
         actual_position = angle_rad + self._position_offset
         
         # Build command frame
-        self._tx_buffer[0] = CMD_POSITION_CONTROL
-        struct.pack_into('<f', self._tx_buffer, 1, actual_position)
-        self._pack_duration(duration_ms)
+        self._pack_control(CMD_POSITION_CONTROL, actual_position, duration_ms)
+    
+    def _build_position_frame(self, angle_rad: float, duration_ms: int) -> bytes:
+        """
+        Build a standalone position control frame (for frames that are sent later)
+        
+        Args:
+            angle_rad: Target position in radians (relative to calibrated zero)
+            duration_ms: Total time from start to stop in milliseconds
         
-        self._send_frame(bytes(self._tx_buffer))
+        Returns:
+            8-byte position control payload
+        """
+        with self._tx_lock:
+            self._pack_position(angle_rad, duration_ms)
+            return bytes(self._tx_buffer)
+    
+    def queue_positions(
+        self,
+        targets: Sequence[tuple[float, int]],
+        settle_ms: int = 0,
+        start: Optional[float] = None
+    ) -> float:
+        """
+        Move through several positions on a fixed schedule and wait for the last one
         
+        Each command is released when the previous move (duration + settle time) is due to
+        finish, measured against a monotonic deadline, so send overhead does not accumulate
+        between moves. The motor does not acknowledge move completion, so the schedule is
+        derived from the commanded durations.
+        
+        Args:
+            targets: Sequence of (angle_rad, duration_ms) tuples, executed in order
+            settle_ms: Extra time to hold each position after its move, in milliseconds
+            start: time.monotonic() time the first move is scheduled from (default: now). Pass
+                   the deadline of the previous move to chain sequences without drift.
+        
+        Returns:
+            time.monotonic() deadline at which the last move and its settle time ended
+        """
+        deadline = time.monotonic() if start is None else start
+        for angle_rad, duration_ms in targets:
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            self.send_position(angle_rad, duration_ms)
+            deadline += (duration_ms + settle_ms) / 1000.0
+        time.sleep(max(0.0, deadline - time.monotonic()))
+        return deadline
+    
+    def send_position_periodic(
+        self,
+        angles_rad: Sequence[float],
+        period_s: float,
+        duration_ms: int = 0,
+        run_for_s: Optional[float] = None
+    ) -> can.broadcastmanager.CyclicSendTaskABC:
+        """
+        Hand a position trajectory to the kernel for timed transmission
+        
+        On SocketCAN, python-can installs this as a broadcast manager (BCM) TX_SETUP task:
+        the kernel sends one frame every period_s, cycling through angles_rad, without
+        waking Python per frame. Frames are built once up front, so the current offset and
+        limits are applied at call time.
+        
+        Args:
+            angles_rad: Target positions in radians (relative to calibrated zero), sent in order
+            period_s: Time between consecutive frames in seconds
+            duration_ms: Move duration encoded in every frame (see send_position)
+            run_for_s: Stop automatically after this many seconds (None = until stopped)
+        
+        Returns:
+            Task handle; call stop() on it to end transmission
+        """
+        if self._bus is None:
+            raise GIM8115Error("Not connected to CAN bus. Call connect() first.")
+        
+        msgs = [
+            can.Message(
+                arbitration_id=self.can_id,
+                data=self._build_position_frame(angle_rad, duration_ms),
+                is_extended_id=False
+            )
+            for angle_rad in angles_rad
+        ]
+        try:
+            return self._bus.send_periodic(msgs, period_s, duration=run_for_s)
+        except Exception as e:
+            raise GIM8115Error(f"Failed to start periodic position task: {e}") from e
+    
     def send_velocity(self, speed_rads: float, duration_ms: int) -> None:
         """
         Send velocity control command
@@ -826,11 +1383,9 @@ class GIM8115Driver:
                         Example: 100ms = 50ms acceleration + 50ms deceleration.
                         Use 0 for immediate execution (max acceleration, no deceleration planning).
         """
-        self._tx_buffer[0] = CMD_VELOCITY_CONTROL
-        struct.pack_into('<f', self._tx_buffer, 1, speed_rads)
-        self._pack_duration(duration_ms)
-        
-        self._send_frame(bytes(self._tx_buffer))
+        with self._tx_lock:
+            self._pack_control(CMD_VELOCITY_CONTROL, speed_rads, duration_ms)
+            self._send_frame()
         
     def send_torque(self, torque_nm: float, duration_ms: int) -> None:
         """
@@ -842,20 +1397,16 @@ class GIM8115Driver:
                         Example: 100ms = 50ms acceleration + 50ms deceleration.
                         Use 0 for immediate execution (max acceleration, no deceleration planning).
         """
-        self._tx_buffer[0] = CMD_TORQUE_CONTROL
-        struct.pack_into('<f', self._tx_buffer, 1, torque_nm)
-        self._pack_duration(duration_ms)
-        
-        self._send_frame(bytes(self._tx_buffer))
+        with self._tx_lock:
+            self._pack_control(CMD_TORQUE_CONTROL, torque_nm, duration_ms)
+            self._send_frame()
         
     def refresh_configuration(self) -> None:
         """
         Refresh configuration - applies all previously modified configurations
         Command 0x82: Byte 0 = 0x82, Bytes 1-7 = NULL (0x00)
         """
-        self._clear_tx_buffer()
-        self._tx_buffer[0] = CMD_REFRESH_CONFIGURATION
-        self._send_frame(bytes(self._tx_buffer))
+        self._send_message(self._refresh_msg)
         
     def retrieve_indicator(self, indi_id: int, timeout: float = 1.0) -> Optional[float]:
         """
@@ -868,29 +1419,87 @@ class GIM8115Driver:
         Returns:
             Indicator value (float), or None if no response or error
         """
-        self._clear_tx_buffer()
-        self._tx_buffer[0] = CMD_RETRIEVE_INDICATOR
-        self._tx_buffer[1] = indi_id
-        self._send_frame(bytes(self._tx_buffer))
-        
-        # Wait for response (accept any CAN ID - motor may respond on different ID)
-        response = self._receive_frame(timeout=timeout, filter_can_id=-1)
+        with self._indicator_lock:
+            _drain(self._indicator_replies)  # Late replies to earlier, timed-out requests
+            with self._tx_lock:
+                self._clear_tx_buffer()
+                self._tx_buffer[0] = CMD_RETRIEVE_INDICATOR
+                self._tx_buffer[1] = indi_id
+                self._send_frame()
+            
+            # Wait for the reply to this indicator (other frames are skipped)
+            response = self._receive_indicator_reply(indi_id, timeout)
         if response is None:
             return None
         
-        # Validate response format
-        if (len(response) != self.FRAME_SIZE or
-            response[0] != CMD_RETRIEVE_INDICATOR or
-            response[1] != indi_id or
-            response[2] != RES_SUCCESS):
+        # Check result code and extract float from bytes 4-7 (little-endian)
+        _, _, result_code, value = _INDICATOR_REPLY.unpack_from(response)
+        if result_code != RES_SUCCESS:
             return None
         
-        # Extract float from bytes 4-7 (little-endian)
-        try:
-            return struct.unpack('<f', response[4:8])[0]
-        except struct.error:
-            return None
+        return value
+    
+    def retrieve_indicators(self, indi_ids: Sequence[int], timeout: float = 1.0) -> tuple[Optional[float], ...]:
+        """
+        Retrieve several indicator values in one bus round trip
+        
+        All requests are sent back-to-back before waiting, and replies are matched by
+        indicator ID in whatever order they arrive, so N indicators cost one round-trip
+        latency instead of N. Indicator round trips are serialized, so concurrent callers
+        (e.g. the status monitor and ping()) never take each other's replies.
+        
+        Args:
+            indi_ids: Indicator IDs (e.g., (INDIID_MEC_ANGLE_SHAFT, INDIID_SPEED_SHAFT))
+            timeout: Timeout in seconds for all replies together
+        
+        Returns:
+            Indicator values in the order of indi_ids (None for missing replies or errors)
+        """
+        with self._indicator_lock:
+            _drain(self._indicator_replies)  # Late replies to earlier, timed-out requests
+            with self._tx_lock:
+                self._clear_tx_buffer()
+                self._tx_buffer[0] = CMD_RETRIEVE_INDICATOR
+                for indi_id in indi_ids:
+                    self._tx_buffer[1] = indi_id
+                    self._send_frame()
+            
+            values: dict[int, Optional[float]] = dict.fromkeys(indi_ids)
+            pending = set(indi_ids)
+            deadline = time.monotonic() + timeout
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # Accept any CAN ID - motor may respond on different ID
+                response = self._receive_frame(timeout=remaining, filter_can_id=-1, replies=self._indicator_replies)
+                if response is None:
+                    break
+                if response[0] != CMD_RETRIEVE_INDICATOR or response[1] not in pending:
+                    continue
+                _, reply_id, result_code, value = _INDICATOR_REPLY.unpack_from(response)
+                pending.discard(reply_id)
+                if result_code == RES_SUCCESS:
+                    values[reply_id] = value
+        
+        return tuple(values[indi_id] for indi_id in indi_ids)
             
+    def ping(self, timeout: float = 0.1) -> bool:
+        """
+        Check that the motor answers on the bus
+        
+        Sends a Retrieve Indicator request for the shaft angle (no effect on motor state)
+        and waits briefly for the reply, so an unpowered motor or dead bus is detected
+        in one short timeout instead of after a sequence of failed commands.
+        
+        Args:
+            timeout: Time to wait for the reply in seconds
+        
+        Returns:
+            True if the motor replied, False otherwise
+        """
+        return self.retrieve_indicator(INDIID_MEC_ANGLE_SHAFT, timeout=timeout) is not None
+    
     def get_current_position(self, timeout: float = 1.0) -> Optional[float]:
         """
         Get current position from motor using Retrieve Indicator command
@@ -921,8 +1530,9 @@ class GIM8115Driver:
         """
         Get full motor status (position, speed, torque, error) efficiently
         
-        Uses retrieve_indicator for position and speed, which doesn't affect motor state.
-        This is safe for continuous 10 Hz monitoring.
+        Uses Retrieve Indicator requests for position and speed, which don't affect motor state.
+        This is safe for continuous 10 Hz monitoring. (The full feedback frame used by
+        parse_feedback() is only sent in reply to control commands, which would move the motor.)
         
         Args:
             timeout: Timeout in seconds (should be short for 10 Hz polling, default: 0.1s)
@@ -935,11 +1545,10 @@ class GIM8115Driver:
         try:
             # Get position and speed using retrieve_indicator (non-intrusive, doesn't affect motor)
             # This is the safest method for continuous monitoring
-            # Use shorter timeout per call to ensure we don't block too long
-            position = self.retrieve_indicator(INDIID_MEC_ANGLE_SHAFT, timeout=timeout/2)
-            # Small delay to avoid race condition with CAN bus responses
-            time.sleep(0.01)  # 10ms delay
-            speed = self.retrieve_indicator(INDIID_SPEED_SHAFT, timeout=timeout/2)
+            # Both requests go out together and share the timeout (one round trip)
+            position, speed = self.retrieve_indicators(
+                (INDIID_MEC_ANGLE_SHAFT, INDIID_SPEED_SHAFT), timeout=timeout
+            )
             
             if position is None:
                 return None  # Position is required
@@ -977,14 +1586,16 @@ class GIM8115Driver:
         # When user sends 0.0, we want: 0.0 + offset = current_pos
         # So: offset = current_pos - 0.0 = current_pos
         self._position_offset = current_pos
+        # Calibration is written immediately (not deferred to flush_config()) so it survives a crash
         self.save_config()
         
-    def parse_feedback(self, data: bytes, check_result: bool = True) -> MotorStatus:
+    def parse_feedback(self, data: Union[bytes, bytearray, memoryview], check_result: bool = True) -> MotorStatus:
         """
         Parse feedback frame from motor
         
         Args:
-            data: 8-byte response frame
+            data: 8-byte response frame. Any bytes-like object is read in place, so a
+                  memoryview slice of a larger buffer (e.g. a CAN log) needs no copy.
             check_result: If True, raise exception on non-success result code
             
         Returns:
@@ -996,36 +1607,16 @@ class GIM8115Driver:
         if len(data) != self.FRAME_SIZE:
             raise GIM8115Error(f"Feedback data must be exactly {self.FRAME_SIZE} bytes")
             
-        # Byte 0: Command echo
-        command_echo = data[0]
-        
-        # Byte 1: Result code
-        result_code = data[1]
+        # Byte 0: Command echo, byte 1: result code, byte 2: temperature (int8),
+        # bytes 3-4: position (uint16), bytes 5-7: packed speed/torque
+        command_echo, result_code, temperature, pos_uint16, st0, st1, st2 = _FEEDBACK_FRAME.unpack_from(data)
         
         if check_result and result_code != RES_SUCCESS:
             raise GIM8115ResultError(result_code)
             
-        # Byte 2: Temperature (int8)
-        temperature = struct.unpack('<b', data[2:3])[0]
-        
-        # Bytes 3-4: Position (uint16, little-endian)
-        pos_uint16 = struct.unpack('<H', data[3:5])[0]
-        # Decode position: pos_rad = (uint16_pos * 25.0 / 65535.0) - 12.5
-        position_rad = (pos_uint16 * 25.0 / 65535.0) - 12.5
-        
-        # Bytes 5-7: Speed & Torque (compressed 12-bit values)
-        # Speed: ST0 (byte 5) is High 8 bits. ST1 bits [7:4] (byte 6, upper 4 bits) are Low 4 bits.
-        speed_int = (data[5] << 4) | ((data[6] & 0xF0) >> 4)
-        # Decode speed: speed_rads = (speed_int * 130.0 / 4095.0) - 65.0
-        speed_rads = (speed_int * 130.0 / 4095.0) - 65.0
-        
-        # Torque: ST1[3:0] (byte 6, lower 4 bits) is high 4 bits, ST2 (byte 7) is low 8 bits
-        torque_int = ((data[6] & 0x0F) << 8) | data[7]
-        # Decode torque: torque_raw = (torque_int * 450.0 / 4095.0) - 225.0 (in Amperes)
-        torque_raw = (torque_int * 450.0 / 4095.0) - 225.0
-        # Convert to N⋅m: torque_nm = (torque_int * (450 * KT * GEAR) / 4095.0) - (225 * KT * GEAR)
-        torque_nm = (torque_int * (450.0 * self.torque_constant * self.gear_ratio) / 4095.0) - \
-                    (225.0 * self.torque_constant * self.gear_ratio)
+        position_rad, speed_rads, torque_raw = _decode_feedback(pos_uint16, st0, st1, st2)
+        # Convert to N⋅m: torque_nm = torque_raw * KT * GEAR
+        torque_nm = torque_raw * self._torque_nm_per_amp
         
         return MotorStatus(
             command_echo=command_echo,
@@ -1036,6 +1627,44 @@ class GIM8115Driver:
             torque_nm=torque_nm,
             torque_raw=torque_raw
         )
+    
+    def decode_feedback_batch(self, frames: bytes) -> dict[str, array]:
+        """
+        Decode many recorded feedback frames into per-field columns
+        
+        Intended for CAN logs and offline analysis: the frames are unpacked with one
+        iter_unpack() pass and the results are stored column-wise in typed arrays
+        instead of one MotorStatus object per frame. Result codes are not checked.
+        
+        Args:
+            frames: Concatenated 8-byte feedback frames (any bytes-like object)
+        
+        Returns:
+            Dictionary of arrays, one entry per frame: 'temperature' (int8), 'position_rad',
+            'speed_rads', 'torque_raw' and 'torque_nm' (float64)
+        """
+        if len(frames) % self.FRAME_SIZE:
+            raise GIM8115Error(f"Frame buffer length must be a multiple of {self.FRAME_SIZE} bytes")
+        
+        temperature = array('b')
+        position_rad = array('d')
+        speed_rads = array('d')
+        torque_raw = array('d')
+        for _, _, temp, pos_uint16, st0, st1, st2 in _FEEDBACK_FRAME.iter_unpack(frames):
+            pos, speed, torque = _decode_feedback(pos_uint16, st0, st1, st2)
+            temperature.append(temp)
+            position_rad.append(pos)
+            speed_rads.append(speed)
+            torque_raw.append(torque)
+        
+        torque_scale = self._torque_nm_per_amp
+        return {
+            'temperature': temperature,
+            'position_rad': position_rad,
+            'speed_rads': speed_rads,
+            'torque_raw': torque_raw,
+            'torque_nm': array('d', [t * torque_scale for t in torque_raw])
+        }
         
     def send_and_receive(
         self,
@@ -1060,9 +1689,29 @@ class GIM8115Driver:
             raise GIM8115Error("Timeout waiting for motor response")
         return self.parse_feedback(response, check_result=check_result)
     
+    def send_and_check(self, payload: bytes, timeout: float = 1.0) -> int:
+        """
+        Send command and return only the result code of the response
+        
+        Lighter variant of send_and_receive() for callers that do not need the feedback
+        values: the reply is not decoded and no MotorStatus is created.
+        
+        Args:
+            payload: 8-byte command payload
+            timeout: Receive timeout in seconds
+        
+        Returns:
+            Result code from byte 1 of the response (RES_SUCCESS = 0x00)
+        """
+        self._send_frame(payload)
+        response = self._receive_frame(timeout=timeout)
+        if response is None:
+            raise GIM8115Error("Timeout waiting for motor response")
+        return response[1]
+    
     def check_safety_message(self, timeout: float = 0.002) -> Optional[tuple[int, int]]:
         """
-        Check for safety CAN messages (ID 0x005) - non-blocking polling method
+        Wait for the next safety CAN message (ID 0x005) queued by the receive thread
         
         Safety message format (CAN ID 0x005):
         - Device 1 Border Limit1: [0x01, 0x10] - hard stop
@@ -1071,45 +1720,127 @@ class GIM8115Driver:
         - Device 1 Safety Limit2: [0x01, 0x12] - approaching limit2 (used for limit finding)
         
         Args:
-            timeout: Timeout in seconds (should be short for non-blocking)
+            timeout: Maximum time in seconds to wait (returns as soon as a frame arrives)
             
         Returns:
             Tuple of (device_id, status) if limit triggered, None otherwise
             - device_id: 0x01 (Device 1)
             - status: 0x10 (Border Limit1), 0x20 (Border Limit2), 0x11 (Safety Limit1), or 0x12 (Safety Limit2)
         """
-        if self._bus is None:
+        if self._rx_sock is None:
             return None
         
         try:
-            msg = self._bus.recv(timeout=timeout)
-            if msg is None:
-                return None
-            
-            # Check if it's a safety message (CAN ID 0x005)
-            if msg.arbitration_id != CAN_ID_SAFETY:
-                return None
-            
-            # Parse safety message: [device_id, status]
-            if len(msg.data) < 2:
-                return None
-            
-            device_id = msg.data[0]
-            status = msg.data[1]
-            
-            # Only process Device 1 (0x01) limit triggers
-            # Accept all status codes: border limits (0x10, 0x20) and safety limits (0x11, 0x12)
-            if device_id == SAFETY_DEVICE_1 and status in (
-                SAFETY_STATUS_MIN_LIMIT, SAFETY_STATUS_MAX_LIMIT,
-                SAFETY_STATUS_LIMIT1_FIND, SAFETY_STATUS_LIMIT2_FIND
-            ):
-                return (device_id, status)
-            
-            return None
-        except Exception:
-            # Ignore errors in non-blocking check
+            return self._safety_queue.get(timeout=timeout)
+        except queue.Empty:
             return None
     
+    def _rx_loop(self) -> None:
+        """
+        Background thread loop receiving every CAN frame and routing it by CAN ID
+        Waits on an epoll-backed selector (registered once) until frames arrive, then reads
+        every queued frame before waiting again. Runs with highest priority, since safety
+        frames are handled here directly. Socket errors (e.g. ENETDOWN while the interface
+        is down) are logged and retried with backoff until disconnect(), so the safety
+        auto-stop resumes as soon as frames arrive again.
+        """
+        self._set_thread_priority()
+        
+        # Retry delay after a socket error, doubled per consecutive error (capped so that
+        # disconnect() can still join the thread)
+        RETRY_MIN = 0.01  # seconds
+        RETRY_MAX = 0.5  # seconds
+        retry_delay = RETRY_MIN
+        errors = 0
+        
+        sock = self._rx_sock
+        frame = self._rx_frame
+        view = self._rx_view
+        
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            selector.register(self._rx_wakeup[0], selectors.EVENT_READ)  # disconnect()
+            
+            while self._rx_running:
+                try:
+                    selector.select()
+                    while self._rx_running:
+                        _, ancdata, flags, _ = sock.recvmsg_into(
+                            (view,), _TIMESTAMP_CMSG_SIZE, socket.MSG_DONTWAIT
+                        )
+                        if errors:
+                            log.warning("CAN receive recovered after %d error(s)", errors)
+                            errors = 0
+                            retry_delay = RETRY_MIN
+                        
+                        can_id = _CAN_FRAME_ID.unpack_from(frame)[0]
+                        if can_id == CAN_ID_SAFETY:
+                            self._dispatch_safety_frame(ancdata)
+                        elif frame[_CAN_FRAME_DLC_OFFSET] == self.FRAME_SIZE:
+                            # Frames sent from this host on the command ID are our own commands
+                            # looped back by the kernel (python-can / BCM sockets), not motor replies
+                            if flags & socket.MSG_DONTROUTE and can_id == self.can_id:
+                                continue
+                            replies = self._reply_routes.get(frame[_CAN_FRAME_DATA_OFFSET], self._reply_queue)
+                            _put_latest(replies, (can_id, bytes(view[_CAN_FRAME_DATA_OFFSET:])))
+                except BlockingIOError:
+                    continue  # Socket drained (or woken up by disconnect())
+                except OSError as e:
+                    if not self._rx_running:
+                        return  # Socket closed by disconnect()
+                    errors += 1
+                    if errors == 1:
+                        log.error("CAN receive error: %s - no replies or safety frames (auto-stop) until "
+                                  "it recovers, retrying", e)
+                    time.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2.0, RETRY_MAX)
+    
+    def _dispatch_safety_frame(self, ancdata: list) -> None:
+        """
+        Handle a safety frame sitting in the receive buffer
+        
+        Safety message format (CAN ID 0x005): [device_id, status]. Fields are read in place
+        from the preallocated frame buffer (no per-frame copies).
+        """
+        frame = self._rx_frame
+        if frame[_CAN_FRAME_DLC_OFFSET] < 2:
+            return
+        
+        device_id = frame[_CAN_FRAME_DATA_OFFSET]
+        status = frame[_CAN_FRAME_DATA_OFFSET + 1]
+        
+        # Only process Device 1 (0x01) limit triggers
+        # Accept every status with a handler: border limits (0x10, 0x20) and safety limits (0x11, 0x12)
+        if device_id != SAFETY_DEVICE_1 or self._SAFETY_HANDLERS[status] is None:
+            return
+        
+        self._last_safety_timestamp = self._kernel_timestamp(ancdata)
+        # Listener reaction (auto-stop) first, then hand the event to check_safety_message() callers
+        if self._safety_listener_running:
+            self._handle_safety_limit(device_id, status)
+        _put_latest(self._safety_queue, (device_id, status))
+    
+    @staticmethod
+    def _kernel_timestamp(ancdata: list) -> float:
+        """Extract the SO_TIMESTAMPNS receive time from recvmsg() ancillary data (falls back to now)"""
+        for level, cmsg_type, cmsg_data in ancdata:
+            if level == socket.SOL_SOCKET and cmsg_type == _SO_TIMESTAMPNS:
+                seconds, nanoseconds = _TIMESPEC.unpack_from(cmsg_data)
+                return seconds + nanoseconds * 1e-9
+        return time.time()
+    
+    def get_last_safety_timestamp(self) -> Optional[float]:
+        """
+        Get the receive time of the last accepted safety message
+        
+        The receive socket enables SO_TIMESTAMPNS, so this is the kernel's receive
+        timestamp (same clock as time.time()), not the time Python read the frame.
+        
+        Returns:
+            Timestamp in seconds since the epoch, or None if no safety message was received yet
+        """
+        return self._last_safety_timestamp
+    
     def _set_thread_priority(self) -> None:
         """Set thread to highest priority (requires appropriate permissions)"""
         try:
@@ -1127,50 +1858,38 @@ class GIM8115Driver:
         except (ImportError, AttributeError):
             pass
     
+    def _on_border_limit(self, device_id: int, status: int) -> None:
+        """Border limit (0x10, 0x20) - hard stop"""
+        if self._auto_stop_on_limit:
+            try:
+                self.stop_motor()
+                log.warning("⚠️  Border limit triggered! Device %02X, Status %02X - Motor stopped", device_id, status)
+            except Exception as e:
+                log.error("Error stopping motor on border limit: %s", e)
+    
+    def _on_safety_limit(self, device_id: int, status: int) -> None:
+        """Safety limit (0x11, 0x12) - just notify, don't stop"""
+        log.info("ℹ️  Safety limit detected: Device %02X, Status %02X", device_id, status)
+    
+    # Safety status byte -> handler (None = status ignored). One indexed load replaces the
+    # comparison chains in _dispatch_safety_frame() and _handle_safety_limit().
+    _SAFETY_HANDLERS: list = [None] * 256
+    _SAFETY_HANDLERS[SAFETY_STATUS_MIN_LIMIT] = _on_border_limit
+    _SAFETY_HANDLERS[SAFETY_STATUS_MAX_LIMIT] = _on_border_limit
+    _SAFETY_HANDLERS[SAFETY_STATUS_LIMIT1_FIND] = _on_safety_limit
+    _SAFETY_HANDLERS[SAFETY_STATUS_LIMIT2_FIND] = _on_safety_limit
+    
     def _handle_safety_limit(self, device_id: int, status: int) -> None:
         """Handle safety limit trigger"""
         # Only stop motor on border limits (0x10, 0x20), not on safety limits (0x11, 0x12)
-        if status == SAFETY_STATUS_MIN_LIMIT or status == SAFETY_STATUS_MAX_LIMIT:
-            # Border limit - hard stop
-            if self._auto_stop_on_limit:
-                try:
-                    self.stop_motor()
-                    print(f"⚠️  Border limit triggered! Device {device_id:02X}, Status {status:02X} - Motor stopped")
-                except Exception as e:
-                    print(f"Error stopping motor on border limit: {e}")
-        else:
-            # Safety limit (0x11, 0x12) - just notify, don't stop
-            print(f"ℹ️  Safety limit detected: Device {device_id:02X}, Status {status:02X}")
+        self._SAFETY_HANDLERS[status](self, device_id, status)
         
         # Call user callback if provided
         if self._safety_callback is not None:
             try:
                 self._safety_callback(device_id, status)
             except Exception as e:
-                print(f"Error in safety callback: {e}")
-    
-    def _safety_listener_loop(self):
-        """
-        Background thread loop for monitoring safety messages
-        Runs at 200 Hz (5ms interval) with highest priority
-        """
-        self._set_thread_priority()
-        
-        # 200 Hz = 5ms interval
-        CHECK_INTERVAL = 0.005  # 5ms = 200 checks per second
-        SAFETY_TIMEOUT = 0.002  # 2ms timeout for 200Hz
-        
-        while self._safety_listener_running:
-            try:
-                result = self.check_safety_message(timeout=SAFETY_TIMEOUT)
-                if result is not None:
-                    device_id, status = result
-                    self._handle_safety_limit(device_id, status)
-            except Exception:
-                # Continue running even if there's an error
-                pass
-            
-            time.sleep(CHECK_INTERVAL)
+                log.error("Error in safety callback: %s", e)
     
     def start_safety_listener(
         self,
@@ -1178,11 +1897,15 @@ class GIM8115Driver:
         callback: Optional[Callable[[int, int], None]] = None
     ) -> None:
         """
-        Start background thread to listen for safety CAN messages (ID 0x005)
+        Start handling safety CAN messages (ID 0x005) in the background
+        
+        Safety frames are handled on the CAN receive thread (SCHED_FIFO when permitted) as
+        soon as they arrive, so the reaction does not wait for a polling interval.
         
         Args:
             auto_stop: If True, automatically stop motor when limit is triggered
-            callback: Optional callback function(device_id, status) called when limit is triggered
+            callback: Optional callback function(device_id, status) called when limit is triggered.
+                      Runs on the receive thread, so it should return quickly.
         """
         if self._bus is None:
             raise GIM8115Error("Not connected to CAN bus. Call connect() first.")
@@ -1196,61 +1919,77 @@ class GIM8115Driver:
         self._auto_stop_on_limit = auto_stop
         self._safety_callback = callback
         self._safety_listener_running = True
-        
-        self._safety_listener_thread = threading.Thread(
-            target=self._safety_listener_loop,
-            daemon=True,
-            name="SafetyListener"
-        )
-        self._safety_listener_thread.start()
-        print("Safety listener started (monitoring CAN ID 0x005 at 200 Hz, highest priority)")
+        log.info("Safety listener started (handling CAN ID 0x005 on the receive thread, highest priority)")
     
     def stop_safety_listener(self) -> None:
-        """Stop the background safety listener thread"""
+        """Stop handling safety messages in the background"""
         if self._safety_listener_running:
             self._safety_listener_running = False
-            if self._safety_listener_thread is not None:
-                self._safety_listener_thread.join(timeout=1.0)
-                self._safety_listener_thread = None
-            print("Safety listener stopped")
+            log.info("Safety listener stopped")
     
     def _status_monitor_loop(self):
         """
         Background thread loop for monitoring motor status at 10 Hz
         Reads position, speed, and error status
         """
-        # 10 Hz = 100ms interval
-        CHECK_INTERVAL = 1.0 / self._status_monitor_rate  # 0.1 seconds for 10 Hz
-        
+        # Failures are counted until the next success and reported at most once per interval
+        FAILURE_LOG_INTERVAL = 5.0  # seconds
         consecutive_failures = 0
-        max_failures = 10  # Warn after 10 consecutive failures
+        next_failure_log = 0.0
+        
+        # Polls are scheduled against a monotonic deadline, so the time spent waiting for
+        # replies is absorbed by the wait instead of stretching the period
+        next_poll = time.monotonic()
         
         while self._status_monitor_running:
             try:
                 # Get motor status (position, speed, error)
-                # Use longer timeout to ensure we get responses (80ms allows 40ms per indicator)
+                # 80ms timeout for both indicator replies together
                 status = self.get_motor_status(timeout=0.08)  # 80ms timeout
-                if status is not None:
-                    consecutive_failures = 0  # Reset failure counter on success
-                    if self._status_callback is not None:
-                        try:
-                            self._status_callback(status)
-                        except Exception as e:
-                            print(f"Error in status callback: {e}")
-                else:
-                    # Status is None - might be timeout or error
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_failures:
-                        print(f"⚠️  Status monitor: {consecutive_failures} consecutive failures (timeout or no response)")
-                        consecutive_failures = 0  # Reset to avoid spam
+                error = "timeout or no response"
             except Exception as e:
-                # Log exception but continue running
+                status = None
+                error = e
+            
+            if status is not None:
+                consecutive_failures = 0  # Reset failure counter on success
+                if self._status_callback is not None:
+                    self._status_queue.append(status)
+                    self._status_ready.set()
+            else:
                 consecutive_failures += 1
-                if consecutive_failures >= max_failures:
-                    print(f"⚠️  Status monitor error: {e}")
-                    consecutive_failures = 0  # Reset to avoid spam
+                now = time.monotonic()
+                if now >= next_failure_log:
+                    log.warning("⚠️  Status monitor: %d consecutive failures (%s)", consecutive_failures, error)
+                    next_failure_log = now + FAILURE_LOG_INTERVAL
             
-            time.sleep(CHECK_INTERVAL)
+            # 10 Hz = 100ms interval (rate is re-read so start_status_monitor() can change it)
+            next_poll += 1.0 / self._status_monitor_rate
+            remaining = next_poll - time.monotonic()
+            if remaining < 0.0:
+                next_poll -= remaining  # Fell behind: restart the schedule instead of bursting
+            elif self._status_stop.wait(remaining):
+                break
+    
+    def _status_dispatch_loop(self):
+        """
+        Background thread loop delivering queued statuses to the status callback
+        Sleeps on an event until the monitor thread queues a status
+        """
+        pending = self._status_queue
+        ready = self._status_ready
+        
+        while self._status_monitor_running:
+            ready.wait()
+            ready.clear()
+            while pending and self._status_monitor_running:
+                status = pending.popleft()
+                callback = self._status_callback
+                if callback is not None:
+                    try:
+                        callback(status)
+                    except Exception as e:
+                        log.error("Error in status callback: %s", e)
     
     def start_status_monitor(
         self,
@@ -1262,7 +2001,9 @@ class GIM8115Driver:
         
         Args:
             rate_hz: Monitoring rate in Hz (default: 10.0 = 10 times per second)
-            callback: Optional callback function(status: MotorStatus) called when status is received
+            callback: Optional callback function(status: MotorStatus) called when status is received.
+                      Runs on a separate dispatcher thread; if it falls behind, the oldest
+                      of up to 128 pending statuses are dropped.
         """
         if self._bus is None:
             raise GIM8115Error("Not connected to CAN bus. Call connect() first.")
@@ -1281,15 +2022,29 @@ class GIM8115Driver:
             daemon=True,
             name="StatusMonitor"
         )
+        self._status_queue.clear()
+        self._status_ready.clear()
+        self._status_stop.clear()
+        self._status_dispatch_thread = threading.Thread(
+            target=self._status_dispatch_loop,
+            daemon=True,
+            name="StatusDispatch"
+        )
         self._status_monitor_thread.start()
-        print(f"Status monitor started (monitoring at {rate_hz} Hz)")
+        self._status_dispatch_thread.start()
+        log.info("Status monitor started (monitoring at %s Hz)", rate_hz)
     
     def stop_status_monitor(self) -> None:
         """Stop the background status monitor thread"""
         if self._status_monitor_running:
             self._status_monitor_running = False
+            self._status_ready.set()  # Wake the dispatcher so it sees the stop flag
+            self._status_stop.set()  # Wake the monitor without waiting out its interval
             if self._status_monitor_thread is not None:
                 self._status_monitor_thread.join(timeout=1.0)
                 self._status_monitor_thread = None
-            print("Status monitor stopped")
+            if self._status_dispatch_thread is not None:
+                self._status_dispatch_thread.join(timeout=1.0)
+                self._status_dispatch_thread = None
+            log.info("Status monitor stopped")
 
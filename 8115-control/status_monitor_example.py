@@ -7,6 +7,11 @@ Usage:
     python3 status_monitor_example.py
 """
 
+import asyncio
+import collections
+import signal
+import sys
+import threading
 import time
 import math
 from gim8115_driver import (
@@ -16,50 +21,65 @@ from gim8115_driver import (
 )
 
 
-# Global variable to access motor instance in callback
-_motor_instance = None
+# Radians -> degrees factor for the per-status display (one multiply instead of math.degrees())
+RAD2DEG = 180.0 / math.pi
+
+# Example headers, each written with a single write
+_HEADER = f"{'=' * 60}\nMotor Status Monitoring Example (10 Hz)\n{'=' * 60}\n"
+_POLLING_HEADER = f"{'=' * 60}\nManual Status Polling Example (10 Hz)\n{'=' * 60}\n"
+_ASYNC_HEADER = f"{'=' * 60}\nAsyncio Status Polling Example (10 Hz)\n{'=' * 60}\n"
+
+# Samples (position_rad, speed_rads, result_code) queued by the callback and printed in
+# batches by the main thread; the oldest samples are dropped if printing falls behind
+_samples: collections.deque = collections.deque(maxlen=64)
 
 def status_callback(status: MotorStatus):
     """
     Callback function called 10 times per second with motor status
     
+    Only queues the values; formatting and printing happen in flush_samples()
+    on the main thread, once per second.
+    
     Args:
         status: MotorStatus object containing position, speed, error, etc.
     """
-    global _motor_instance
+    _samples.append((status.position_rad, status.speed_rads, status.result_code))
+
+
+def flush_samples(position_offset: float) -> None:
+    """
+    Print all queued samples with a single write
     
-    # Calculate relative position (relative to zero) using position_offset
-    # Position from status is absolute, we need to subtract offset to get relative position
-    if _motor_instance is not None:
-        position_abs = status.position_rad
-        position_offset = _motor_instance.get_position_offset()
+    Args:
+        position_offset: Motor position offset, subtracted to show position relative to zero
+    """
+    lines = []
+    while _samples:
+        position_abs, speed, result_code = _samples.popleft()
+        # Position from status is absolute, subtract offset to get relative position
         position_rel = position_abs - position_offset
-    else:
-        position_rel = status.position_rad  # Fallback to absolute if motor not available
-    
-    # Check for errors (result_code from status)
-    error_str = "OK" if status.result_code == 0x00 else f"Error: 0x{status.result_code:02X}"
-    
-    # Print status with relative position
-    print(f"Status: Pos={math.degrees(position_rel):7.2f}° (abs: {math.degrees(status.position_rad):7.2f}°) | "
-          f"Speed={status.speed_rads:6.2f} rad/s ({math.degrees(status.speed_rads):6.2f}°/s) | "
-          f"{error_str}")
+        
+        # Check for errors (result_code from status)
+        error_str = "OK" if result_code == 0x00 else f"Error: 0x{result_code:02X}"
+        
+        lines.append(f"Status: Pos={position_rel * RAD2DEG:7.2f}° (abs: {position_abs * RAD2DEG:7.2f}°) | "
+                     f"Speed={speed:6.2f} rad/s ({speed * RAD2DEG:6.2f}°/s) | "
+                     f"{error_str}\n")
+    if lines:
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
 
 
 def main():
     """
     Example of monitoring motor status at 10 Hz
     """
-    print("=" * 60)
-    print("Motor Status Monitoring Example (10 Hz)")
-    print("=" * 60)
+    sys.stdout.write(_HEADER)
     
     # Motor parameters (adjust based on your motor specifications)
     TORQUE_CONSTANT = 1  # N⋅m/A (example value, check motor datasheet)
     GEAR_RATIO = 36  # Gear ratio
     
-    global _motor_instance
-    
     try:
         with GIM8115Driver(
             interface="can0",
@@ -68,8 +88,6 @@ def main():
             torque_constant=TORQUE_CONSTANT,
             gear_ratio=GEAR_RATIO
         ) as motor:
-            _motor_instance = motor  # Store for use in callback
-            
             print("\n1. Starting motor...")
             motor.start_motor()
             time.sleep(0.3)
@@ -81,20 +99,19 @@ def main():
             print()
             motor.start_status_monitor(rate_hz=10.0, callback=status_callback)
             print("   ✓ Status monitor started")
-            print("   Status updates will appear below (10 times per second):\n")
+            print("   Status updates will appear below (10 per second, printed once per second):\n")
             
             # Keep running to receive continuous status updates
-            # The status monitor runs in a background thread and calls the callback
+            # The status monitor runs in a background thread and calls the callback;
+            # the main thread only wakes once per second to print the queued samples
+            stop_evt = threading.Event()
+            previous_handler = signal.signal(signal.SIGINT, lambda *args: stop_evt.set())
             try:
-                loop_count = 0
-                while True:
-                    time.sleep(1.0)  # Sleep 1 second at a time
-                    loop_count += 1
-                    # Print a heartbeat every 10 seconds to show we're still running
-                    if loop_count % 10 == 0:
-                        print(f"   [Heartbeat: Still monitoring... ({loop_count}s elapsed)]")
-            except KeyboardInterrupt:
-                print("\n\n   Stopping status monitor...")
+                while not stop_evt.wait(1.0):
+                    flush_samples(motor.position_offset)
+            finally:
+                signal.signal(signal.SIGINT, previous_handler)
+            flush_samples(motor.position_offset)
             
             print("\n3. Stopping status monitor...")
             motor.stop_status_monitor()
@@ -124,9 +141,7 @@ def manual_polling_example():
     """
     Alternative example: Manual polling at 10 Hz (without background thread)
     """
-    print("=" * 60)
-    print("Manual Status Polling Example (10 Hz)")
-    print("=" * 60)
+    sys.stdout.write(_POLLING_HEADER)
     
     TORQUE_CONSTANT = 1
     GEAR_RATIO = 36
@@ -149,7 +164,9 @@ def manual_polling_example():
             print()
             
             poll_interval = 0.1  # 10 Hz = 100ms = 0.1 seconds
-            start_time = time.time()
+            start_time = time.monotonic()
+            # Absolute deadlines keep the rate at 10 Hz regardless of receive/print time
+            next_deadline = start_time
             
             try:
                 while True:
@@ -160,15 +177,21 @@ def manual_polling_example():
                         position_rel = status.position_rad
                         error_str = "OK" if status.result_code == 0x00 else f"Error: 0x{status.result_code:02X}"
                         
-                        elapsed = time.time() - start_time
-                        print(f"[{elapsed:6.2f}s] Pos={math.degrees(position_rel):6.2f}° | "
+                        elapsed = time.monotonic() - start_time
+                        print(f"[{elapsed:6.2f}s] Pos={position_rel * RAD2DEG:6.2f}° | "
                               f"Speed={status.speed_rads:6.2f} rad/s | "
                               f"Temp={status.temperature:3d}°C | "
                               f"{error_str}")
                     else:
                         print("   No status received")
                     
-                    time.sleep(poll_interval)
+                    next_deadline += poll_interval
+                    sleep_for = next_deadline - time.monotonic()
+                    if sleep_for > 0:
+                        time.sleep(sleep_for)
+                    elif sleep_for < -poll_interval:
+                        # Stalled for more than a period: restart the schedule instead of bursting
+                        next_deadline = time.monotonic()
                     
             except KeyboardInterrupt:
                 print("\n   Polling stopped by user")
@@ -180,10 +203,65 @@ def manual_polling_example():
         print(f"\n✗ GIM8115 Error: {e}")
 
 
+async def _print_status_async(motor: GIM8115Driver) -> None:
+    """
+    Print motor status at 10 Hz from an asyncio event loop
+    
+    Args:
+        motor: Connected driver
+    """
+    start_time = time.monotonic()
+    async for status in motor.iter_status(rate_hz=10.0):
+        elapsed = time.monotonic() - start_time
+        print(f"[{elapsed:6.2f}s] Pos={status.position_rad * RAD2DEG:6.2f}° | "
+              f"Speed={status.speed_rads:6.2f} rad/s")
+
+
+def async_polling_example():
+    """
+    Alternative example: status at 10 Hz with `async for` (no callback thread)
+    """
+    sys.stdout.write(_ASYNC_HEADER)
+    
+    TORQUE_CONSTANT = 1
+    GEAR_RATIO = 36
+    
+    try:
+        with GIM8115Driver(
+            interface="can0",
+            can_id=0x0A,
+            bitrate=500000,
+            torque_constant=TORQUE_CONSTANT,
+            gear_ratio=GEAR_RATIO
+        ) as motor:
+            
+            print("\n1. Starting motor...")
+            motor.start_motor()
+            time.sleep(0.3)
+            
+            print("\n2. Polling status with motor.iter_status() at 10 Hz...")
+            print("   (Press Ctrl+C to stop)")
+            print()
+            
+            try:
+                asyncio.run(_print_status_async(motor))
+            except KeyboardInterrupt:
+                print("\n   Polling stopped by user")
+            
+            motor.stop_motor()
+            print("\n✓ Asyncio polling example completed!")
+    
+    except GIM8115Error as e:
+        print(f"\n✗ GIM8115 Error: {e}")
+
+
 if __name__ == "__main__":
     # Run callback-based example
     main()
     
     # Uncomment to run manual polling example instead:
     # manual_polling_example()
+    
+    # Or the asyncio version:
+    # async_polling_example()
 
@@ -24,14 +24,20 @@ Keyboard Controls:
     'q' - Quit
 """
 
+import asyncio
+import logging
+import logging.handlers
+import os
+import queue
 import sys
-import time
-import select
 import termios
 import tty
 import can
 import argparse
-import subprocess
+
+# CAN traffic log ("Sent: ..." lines). main() routes it through a queue so sends never
+# block on terminal output; use -q to silence it
+log = logging.getLogger("safety_emu")
 
 # CAN Configuration
 CAN_ID_SAFETY = 0x005
@@ -46,14 +52,73 @@ STATUS_LIMIT2_FIND = 0x12
 # Heartbeat interval: 5 seconds (matches firmware)
 HEARTBEAT_INTERVAL = 5.0
 
+# Console banner printed by run(), written with a single write
+_BANNER_FMT = """
+Safety Node Emulator - Device {device}
+==================================================
+Keyboard Controls:
+  Device 1:
+    '1' - Trigger Device 1 Min Limit (0x005 [0x01, 0x10])
+    '2' - Trigger Device 1 Max Limit (0x005 [0x01, 0x20])
+    '3' - Trigger Device 1 Limit1 Find (0x005 [0x01, 0x11])
+    '4' - Trigger Device 1 Limit2 Find (0x005 [0x01, 0x12])
+  Device 2:
+    '5' - Trigger Device 2 Min Limit (0x005 [0x02, 0x10])
+    '6' - Trigger Device 2 Max Limit (0x005 [0x02, 0x20])
+    '7' - Trigger Device 2 Limit1 Find (0x005 [0x02, 0x11])
+    '8' - Trigger Device 2 Limit2 Find (0x005 [0x02, 0x12])
+  'q' - Quit
+==================================================
+
+Sending heartbeat every {interval}s as Device {device}
+Press keys to inject faults...
+
+"""
+
+# Keyboard key -> (DeviceID, Status) of the limit switch message it triggers
+KEY_MESSAGES = {
+    '1': (DEVICE_ID_1, STATUS_MIN_LIMIT),
+    '2': (DEVICE_ID_1, STATUS_MAX_LIMIT),
+    '3': (DEVICE_ID_1, STATUS_LIMIT1_FIND),
+    '4': (DEVICE_ID_1, STATUS_LIMIT2_FIND),
+    '5': (DEVICE_ID_2, STATUS_MIN_LIMIT),
+    '6': (DEVICE_ID_2, STATUS_MAX_LIMIT),
+    '7': (DEVICE_ID_2, STATUS_LIMIT1_FIND),
+    '8': (DEVICE_ID_2, STATUS_LIMIT2_FIND),
+}
+
 # CAN interface (default: can0, matching motor driver)
 CAN_INTERFACE = "can0"
 CAN_BITRATE = 500000
 
 
+def _safety_message(payload: bytes) -> tuple:
+    """
+    Build a safety frame once, together with its console line
+    
+    Args:
+        payload: [DeviceID] (heartbeat) or [DeviceID, Status] (limit switch)
+    
+    Returns:
+        Tuple of (can.Message, "Sent: ..." log line)
+    """
+    msg = can.Message(
+        arbitration_id=CAN_ID_SAFETY,
+        data=payload,
+        is_extended_id=False
+    )
+    return msg, f"Sent: 0x{CAN_ID_SAFETY:03X} [{payload.hex(' ').upper()}]"
+
+
 class SafetyEmulator:
     """Safety Node Emulator for CAN bus testing"""
     
+    __slots__ = (
+        "device_id", "interface", "bitrate", "bus", "running",
+        "_limit_messages", "_heartbeat_task",
+        "_done", "_send_tasks", "_send_lock", "old_settings",
+    )
+    
     def __init__(self, device_id: int, interface: str = CAN_INTERFACE, bitrate: int = CAN_BITRATE):
         """
         Initialize the safety emulator
@@ -72,6 +137,19 @@ class SafetyEmulator:
         self.bus = None
         self.running = False
         
+        # Prebuilt limit switch messages (reused for every send) by (DeviceID, Status)
+        self._limit_messages = {
+            key: _safety_message(bytes(key)) for key in KEY_MESSAGES.values()
+        }
+        
+        # Kernel-timed heartbeat task (started in connect())
+        self._heartbeat_task = None
+        
+        # Event loop state while run() is active
+        self._done = None  # Future resolved on quit (or failed with a send error)
+        self._send_tasks = set()  # Pending key press sends (referenced until done)
+        self._send_lock = asyncio.Lock()  # Keeps key press messages in order
+        
         # Save original terminal settings for restoration
         self.old_settings = None
     
@@ -79,22 +157,16 @@ class SafetyEmulator:
         """Connect to CAN bus"""
         # Check if interface exists and is up (optional check)
         try:
-            result = subprocess.run(
-                ["ip", "link", "show", self.interface],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if result.returncode != 0:
-                print(f"WARNING: CAN interface '{self.interface}' not found.", file=sys.stderr)
-                print(f"  Try: sudo ip link set {self.interface} up type can bitrate {self.bitrate}", file=sys.stderr)
-            elif "state DOWN" in result.stdout:
+            # sysfs read instead of forking `ip link show`; vcan reports "unknown" when up
+            with open(f"/sys/class/net/{self.interface}/operstate") as f:
+                state = f.read().strip()
+            if state == "down":
                 print(f"WARNING: CAN interface '{self.interface}' is DOWN.", file=sys.stderr)
                 print(f"  Try: sudo ip link set {self.interface} up", file=sys.stderr)
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            # Continue anyway - interface check is optional
-            pass
-        except Exception:
+        except FileNotFoundError:
+            print(f"WARNING: CAN interface '{self.interface}' not found.", file=sys.stderr)
+            print(f"  Try: sudo ip link set {self.interface} up type can bitrate {self.bitrate}", file=sys.stderr)
+        except OSError:
             # Ignore interface check errors, try connecting anyway
             pass
         
@@ -106,6 +178,14 @@ class SafetyEmulator:
                 bitrate=self.bitrate
             )
             print(f"Connected to CAN bus: {self.interface} at {self.bitrate} bps")
+            
+            # Heartbeat payload: [DeviceID] (1 byte). On SocketCAN this becomes a broadcast
+            # manager (BCM) task, so the kernel sends it every HEARTBEAT_INTERVAL on its own
+            device_id_byte = DEVICE_ID_1 if self.device_id == 1 else DEVICE_ID_2
+            heartbeat_msg, line = _safety_message(bytes([device_id_byte]))
+            self._heartbeat_task = self.bus.send_periodic(heartbeat_msg, HEARTBEAT_INTERVAL)
+            # Heartbeats are no longer sent from Python, so they are logged once here
+            log.info("%s every %ss (kernel periodic task)", line, HEARTBEAT_INTERVAL)
         except can.CanError as e:
             raise RuntimeError(
                 f"Failed to connect to CAN bus '{self.interface}': {e}\n"
@@ -117,39 +197,24 @@ class SafetyEmulator:
     
     def disconnect(self):
         """Disconnect from CAN bus"""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.stop()
+            self._heartbeat_task = None
         if self.bus:
             self.bus.shutdown()
             self.bus = None
     
-    def send_heartbeat(self, device_id: int):
+    def _send(self, msg: can.Message):
         """
-        Send heartbeat message on CAN bus (1 byte: DeviceID only)
+        Send a message without blocking, with one short retry if the TX queue is full
         
         Args:
-            device_id: Device ID (0x01 or 0x02)
+            msg: Prebuilt message to send
         """
-        if not self.bus:
-            raise RuntimeError("Not connected to CAN bus")
-        
-        # Heartbeat payload: [DeviceID] (1 byte)
-        payload = bytes([device_id])
-        
-        # Create and send CAN message
-        msg = can.Message(
-            arbitration_id=CAN_ID_SAFETY,
-            data=payload,
-            is_extended_id=False
-        )
-        
         try:
-            self.bus.send(msg, timeout=0.1)
-            print(f"Sent: 0x{CAN_ID_SAFETY:03X} [{payload.hex(' ').upper()}]")
-        except can.CanError as e:
-            print(f"ERROR: Failed to send heartbeat: {e}", file=sys.stderr)
-            raise
-        except Exception as e:
-            print(f"ERROR: Unexpected error sending heartbeat: {e}", file=sys.stderr)
-            raise
+            self.bus.send(msg, timeout=0.0)
+        except can.CanOperationError:
+            self.bus.send(msg, timeout=0.05)
     
     def send_limit_switch_message(self, device_id: int, status: int):
         """
@@ -163,18 +228,12 @@ class SafetyEmulator:
             raise RuntimeError("Not connected to CAN bus")
         
         # Limit switch payload: [DeviceID, Status] (2 bytes)
-        payload = bytes([device_id, status])
-        
-        # Create and send CAN message
-        msg = can.Message(
-            arbitration_id=CAN_ID_SAFETY,
-            data=payload,
-            is_extended_id=False
-        )
+        key = (device_id, status)
+        msg, line = self._limit_messages.get(key) or _safety_message(bytes(key))
         
         try:
-            self.bus.send(msg, timeout=0.1)
-            print(f"Sent: 0x{CAN_ID_SAFETY:03X} [{payload.hex(' ').upper()}]")
+            self._send(msg)
+            log.info("%s", line)
         except can.CanError as e:
             print(f"ERROR: Failed to send limit switch message: {e}", file=sys.stderr)
             raise
@@ -182,6 +241,38 @@ class SafetyEmulator:
             print(f"ERROR: Unexpected error sending limit switch message: {e}", file=sys.stderr)
             raise
     
+    async def send_limit_switch_message_async(self, device_id: int, status: int):
+        """
+        Awaitable version of send_limit_switch_message()
+        
+        The first, non-blocking send runs on the event loop; only the retry after a full
+        TX queue runs in a worker thread (asyncio.to_thread), so other tasks keep running
+        while it waits. Concurrent calls are sent in call order.
+        
+        Args:
+            device_id: Device ID (0x01 or 0x02)
+            status: Status code (0x10, 0x20, 0x11, or 0x12)
+        """
+        if not self.bus:
+            raise RuntimeError("Not connected to CAN bus")
+        
+        key = (device_id, status)
+        msg, line = self._limit_messages.get(key) or _safety_message(bytes(key))
+        
+        async with self._send_lock:
+            try:
+                try:
+                    self.bus.send(msg, timeout=0.0)
+                except can.CanOperationError:
+                    await asyncio.to_thread(self.bus.send, msg, 0.05)
+                log.info("%s", line)
+            except can.CanError as e:
+                print(f"ERROR: Failed to send limit switch message: {e}", file=sys.stderr)
+                raise
+            except Exception as e:
+                print(f"ERROR: Unexpected error sending limit switch message: {e}", file=sys.stderr)
+                raise
+    
     def setup_keyboard(self):
         """Setup terminal for non-blocking keyboard input"""
         self.old_settings = termios.tcgetattr(sys.stdin)
@@ -192,82 +283,63 @@ class SafetyEmulator:
         if self.old_settings:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
     
-    def get_key(self) -> str:
+    def _on_key(self):
+        """Handle one key press (called by the event loop when stdin is readable)"""
+        key = os.read(sys.stdin.fileno(), 1).decode(errors="ignore")
+        if key in ('', 'q', '\x1b'):  # EOF, 'q' or ESC
+            print("\nQuitting...")
+            self._finish()
+            return
+        
+        message = KEY_MESSAGES.get(key)
+        if message is None:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self.send_limit_switch_message_async(*message))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._on_send_done)
+    
+    def _on_send_done(self, task: asyncio.Task):
+        """Forget a finished key press send; a send error stops run()"""
+        self._send_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._finish(task.exception())
+    
+    def _finish(self, error: Exception = None):
+        """Stop run(); a send error is re-raised from run()"""
+        self.running = False
+        if self._done is not None and not self._done.done():
+            if error is None:
+                self._done.set_result(None)
+            else:
+                self._done.set_exception(error)
+    
+    async def run(self):
         """
-        Get a key press without blocking (non-blocking)
+        Run the emulator until 'q'/ESC is pressed
         
-        Returns:
-            Key character if pressed, None otherwise
+        Key presses are event-driven (stdin is registered with the event loop) and the
+        heartbeat is sent by the kernel task started in connect(), so the process sleeps
+        between key presses instead of polling. Start with asyncio.run(emulator.run()).
         """
-        if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-            return sys.stdin.read(1)
-        return None
-    
-    def run(self):
-        """Run the emulator main loop"""
-        print(f"\nSafety Node Emulator - Device {self.device_id}")
-        print("=" * 50)
-        print("Keyboard Controls:")
-        print("  Device 1:")
-        print("    '1' - Trigger Device 1 Min Limit (0x005 [0x01, 0x10])")
-        print("    '2' - Trigger Device 1 Max Limit (0x005 [0x01, 0x20])")
-        print("    '3' - Trigger Device 1 Limit1 Find (0x005 [0x01, 0x11])")
-        print("    '4' - Trigger Device 1 Limit2 Find (0x005 [0x01, 0x12])")
-        print("  Device 2:")
-        print("    '5' - Trigger Device 2 Min Limit (0x005 [0x02, 0x10])")
-        print("    '6' - Trigger Device 2 Max Limit (0x005 [0x02, 0x20])")
-        print("    '7' - Trigger Device 2 Limit1 Find (0x005 [0x02, 0x11])")
-        print("    '8' - Trigger Device 2 Limit2 Find (0x005 [0x02, 0x12])")
-        print("  'q' - Quit")
-        print("=" * 50)
-        print(f"\nSending heartbeat every {HEARTBEAT_INTERVAL}s as Device {self.device_id}")
-        print("Press keys to inject faults...\n")
+        sys.stdout.write(_BANNER_FMT.format(device=self.device_id, interval=HEARTBEAT_INTERVAL))
+        sys.stdout.flush()
         
+        loop = asyncio.get_running_loop()
+        self._done = loop.create_future()
         self.running = True
         self.setup_keyboard()
-        last_heartbeat = time.time()
+        stdin_fd = sys.stdin.fileno()
         
         try:
-            while self.running:
-                current_time = time.time()
-                
-                # Send heartbeat if interval elapsed
-                if current_time - last_heartbeat >= HEARTBEAT_INTERVAL:
-                    device_id_byte = DEVICE_ID_1 if self.device_id == 1 else DEVICE_ID_2
-                    self.send_heartbeat(device_id_byte)
-                    last_heartbeat = current_time
-                
-                # Check for key press
-                key = self.get_key()
-                if key:
-                    if key == 'q' or key == '\x1b':  # 'q' or ESC
-                        print("\nQuitting...")
-                        self.running = False
-                    # Device 1 controls
-                    elif key == '1':
-                        self.send_limit_switch_message(DEVICE_ID_1, STATUS_MIN_LIMIT)
-                    elif key == '2':
-                        self.send_limit_switch_message(DEVICE_ID_1, STATUS_MAX_LIMIT)
-                    elif key == '3':
-                        self.send_limit_switch_message(DEVICE_ID_1, STATUS_LIMIT1_FIND)
-                    elif key == '4':
-                        self.send_limit_switch_message(DEVICE_ID_1, STATUS_LIMIT2_FIND)
-                    # Device 2 controls
-                    elif key == '5':
-                        self.send_limit_switch_message(DEVICE_ID_2, STATUS_MIN_LIMIT)
-                    elif key == '6':
-                        self.send_limit_switch_message(DEVICE_ID_2, STATUS_MAX_LIMIT)
-                    elif key == '7':
-                        self.send_limit_switch_message(DEVICE_ID_2, STATUS_LIMIT1_FIND)
-                    elif key == '8':
-                        self.send_limit_switch_message(DEVICE_ID_2, STATUS_LIMIT2_FIND)
-                
-                # Small sleep to prevent excessive CPU usage
-                time.sleep(0.01)
-        
-        except KeyboardInterrupt:
-            print("\nInterrupted by user")
+            loop.add_reader(stdin_fd, self._on_key)
+            await self._done
         finally:
+            loop.remove_reader(stdin_fd)
+            if self._send_tasks:
+                await asyncio.gather(*self._send_tasks, return_exceptions=True)
+            self._done = None
+            self.running = False
             self.restore_keyboard()
             self.disconnect()
 
@@ -297,9 +369,22 @@ def main():
         default=CAN_BITRATE,
         help=f"CAN bus bitrate in bits/s (default: {CAN_BITRATE})"
     )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Do not log sent CAN messages"
+    )
     
     args = parser.parse_args()
     
+    # Producers only enqueue the record; the listener thread writes it to stdout
+    log_queue = queue.SimpleQueue()
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.WARNING if args.quiet else logging.INFO)
+    log.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    
     emulator = SafetyEmulator(
         device_id=args.device_id,
         interface=args.interface,
@@ -308,10 +393,14 @@ def main():
     
     try:
         emulator.connect()
-        emulator.run()
+        asyncio.run(emulator.run())
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":